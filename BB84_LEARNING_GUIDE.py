@@ -4,91 +4,220 @@ Comprehensive BB84 Learning Guide PDF
 Contains all questions asked, answers, and mathematical formulas
 """
 
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle, Preformatted
-from reportlab.lib import colors
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
-from datetime import datetime
-
-def create_learning_guide():
-    """Create comprehensive BB84 learning guide with Q&A and formulas"""
-    
-    # Create PDF
-    filename = "BB84_Complete_Learning_Guide.pdf"
-    doc = SimpleDocTemplate(filename, pagesize=letter,
-                           rightMargin=0.75*inch, leftMargin=0.75*inch,
-                           topMargin=0.75*inch, bottomMargin=0.75*inch)
-    
-    story = []
-    styles = getSampleStyleSheet()
-    
-    # Custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        textColor=colors.HexColor('#1e40af'),
-        spaceAfter=12,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Bold'
-    )
-    
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=colors.HexColor('#2563eb'),
-        spaceAfter=10,
-        spaceBefore=10,
-        fontName='Helvetica-Bold'
-    )
-    
-    subheading_style = ParagraphStyle(
-        'CustomSubheading',
-        parent=styles['Heading3'],
-        fontSize=12,
-        textColor=colors.HexColor('#0891b2'),
-        spaceAfter=8,
-        spaceBefore=8,
-        fontName='Helvetica-Bold'
-    )
+import copy
+import io
+import itertools
+import logging
+import os
+from datetime import date
+from functools import cache, lru_cache
+from types import SimpleNamespace
+
+logger = logging.getLogger(__name__)
+
+# Written to the current working directory
+PDF_FILENAME = "BB84_Complete_Learning_Guide.pdf"
+
+# Static guide data, allocated once at import
+_TOC_ITEMS = (
+    "1. Questions Asked & Answers",
+    "2. Mathematical Formulas & Equations",
+    "3. Key Concepts Explained",
+    "4. Practical Implementation Details",
+)
+
+_FORMULAS = (
+    ("Sift Rate (Success Rate)", "Sift_Rate = (Sifted_Bits / Transmitted_Bits) × 100%",
+     "Percentage of transmitted bits where Alice and Bob used same basis"),
+
+    ("Expected Sift Rate (No Eve)", "Sift_Rate_Expected = 50%",
+     "Since each person randomly chooses basis independently"),
+
+    ("Sifted Key Rate", "Sifted_Rate = (Sifted_Count / Total_Transmitted) × 100%",
+     "Shows efficiency for each scenario (No Eve vs With Eve)"),
+
+    ("Eve's Impact on Sifting", "Impact = Sift_Rate_NoEve - Sift_Rate_WithEve",
+     "Percentage point difference showing eavesdropping effect"),
+
+    ("Bits Lost to Eve", "Bits_Lost = Sifted_Count_NoEve - Sifted_Count_WithEve",
+     "Absolute count of sifted bits lost due to eavesdropping"),
+)
+
+_CONCEPTS = (
+    ("Basis Matching",
+     "When Alice's basis equals Bob's basis for a particular qubit. Essential for BB84 sifting."),
+
+    ("Sifting",
+     "Process of keeping only bits where Alice and Bob used the same measurement basis."),
+
+    ("Eavesdropping Detection",
+     "Detected through QBER (error rate), not through missing bits. Eve's measurements introduce errors."),
+
+    ("Quantum Measurement",
+     "Collapses superposition to definite state. Measuring in wrong basis gives random result."),
+
+    ("Quantum Uncertainty",
+     "Cannot know arbitrary observable of quantum state without destroying it (Heisenberg principle)."),
+
+    ("Information-Theoretic Security",
+     "Security guaranteed by laws of physics, not computational complexity. Eve gains negligible information."),
+)
+
+_METRICS_DATA = (
+    ("Metric", "Formula", "Meaning"),
+    ("Transmitted", "num_bits", "Total qubits sent"),
+    ("Sift Rate", "(sifted/transmitted)×100%", "Success in basis matching"),
+    ("Sifted Bits", "count where basis match", "Usable bits for key"),
+    ("Errors", "sifted_bits - correct_bits", "Mismatches in sifted bits"),
+    ("QBER", "(errors/sifted)×100%", "Error rate indicator"),
+    ("Final Key", "privacy_amplify(sifted)", "Cryptographically secure key"),
+    ("Key Rate", "final_key/transmitted", "Protocol efficiency"),
+)
+
+@cache
+def _get_styles():
+    """Import ReportLab and build the shared styles on first use.
+
+    Importing this module stays cheap; the fonts, styles, colors, table styles
+    and page template are created once per process, on the first build.
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.platypus import Frame, PageBreak, PageTemplate, Paragraph, Spacer, TableStyle
+    
+    # Register the Helvetica family once so <b>/<i> runs resolve straight from
+    # ReportLab's font cache, and share one interned bold font name
+    pdfmetrics.registerFontFamily('Helvetica', normal='Helvetica', bold='Helvetica-Bold',
+                                  italic='Helvetica-Oblique', boldItalic='Helvetica-BoldOblique')
+    bold = 'Helvetica-Bold'
+    
+    # Layout dimensions, converted to points once
+    margin = 0.75*inch
+    
+    # Palette colors, parsed from hex once
+    blue = colors.HexColor('#1e40af')
+    indigo = colors.HexColor('#2563eb')
+    cyan = colors.HexColor('#0891b2')
+    table_grid = colors.HexColor('#e0e7ff')
+    table_alt = colors.HexColor('#f8f9fa')
+    
+    sample = getSampleStyleSheet()
     
     normal_style = ParagraphStyle(
         'CustomNormal',
-        parent=styles['Normal'],
+        parent=sample['Normal'],
         fontSize=10,
         alignment=TA_JUSTIFY,
         spaceAfter=6
     )
     
-    # Title Page
-    story.append(Paragraph("BB84 Quantum Key Distribution", title_style))
-    story.append(Paragraph("Complete Learning Guide", title_style))
-    story.append(Spacer(1, 0.3*inch))
-    story.append(Paragraph(f"Generated: {datetime.now().strftime('%B %d, %Y')}", normal_style))
-    story.append(Paragraph("JNTUA ECE Department | Team Silicon", normal_style))
-    story.append(PageBreak())
-    
-    # Table of Contents
-    story.append(Paragraph("Table of Contents", heading_style))
-    toc_items = [
-        "1. Questions Asked & Answers",
-        "2. Mathematical Formulas & Equations",
-        "3. Key Concepts Explained",
-        "4. Practical Implementation Details"
+    header_style = [
+        ('BACKGROUND', (0, 0), (-1, 0), indigo),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), bold),
+        ('FONTSIZE', (0, 0), (-1, 0), 9),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
     ]
-    for item in toc_items:
-        story.append(Paragraph(item, normal_style))
-    story.append(PageBreak())
     
+    return SimpleNamespace(
+        PAGESIZE=letter,
+        MARGIN=margin,
+        METRICS_COL_WIDTHS=(1.5*inch, 2.0*inch, 2.5*inch),
+        FORMULA_COL_WIDTHS=(1.5*inch, 3.3*inch, 2.2*inch),
+        
+        # Spacers and page breaks hold no per-build state, so single
+        # instances are shared by every section
+        SPACER_MED=Spacer(1, 0.15*inch),
+        SPACER_LARGE=Spacer(1, 0.3*inch),
+        PAGE_BREAK=PageBreak(),
+        
+        TITLE=ParagraphStyle(
+            'CustomTitle',
+            parent=sample['Heading1'],
+            fontSize=24,
+            textColor=blue,
+            spaceAfter=12,
+            alignment=TA_CENTER,
+            fontName=bold
+        ),
+        HEADING=ParagraphStyle(
+            'CustomHeading',
+            parent=sample['Heading2'],
+            fontSize=14,
+            textColor=indigo,
+            spaceAfter=10,
+            spaceBefore=10,
+            fontName=bold
+        ),
+        SUBHEADING=ParagraphStyle(
+            'CustomSubheading',
+            parent=sample['Heading3'],
+            fontSize=12,
+            textColor=cyan,
+            spaceAfter=8,
+            spaceBefore=8,
+            fontName=bold
+        ),
+        NORMAL=normal_style,
+        FORMULA=ParagraphStyle(
+            'Formula',
+            parent=sample['Normal'],
+            fontName='Courier',
+            fontSize=10,
+            textColor=blue
+        ),
+        
+        # Closing rule and sign-off
+        FOOTER_FLOWABLES=(
+            Paragraph("=" * 80, normal_style),
+            Paragraph("End of Learning Guide",
+                      ParagraphStyle('Footer', parent=sample['Normal'], alignment=TA_CENTER, fontSize=10)),
+        ),
+        
+        # Validated once and shared by every table
+        METRICS_STYLE=TableStyle(header_style + [
+            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+            ('GRID', (0, 0), (-1, -1), 0.5, table_grid),
+            ('FONTSIZE', (0, 1), (-1, -1), 8),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, table_alt]),
+        ]),
+        FORMULA_TABLE_STYLE=TableStyle(header_style + [
+            ('GRID', (0, 0), (-1, -1), 0.5, table_grid),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, table_alt]),
+        ]),
+        
+        # One frame and page template for every page of every build; the
+        # frame is reset at each page start, so sequential builds can share it
+        PAGE_TEMPLATE=PageTemplate(id='main', frames=[
+            Frame(margin, margin, letter[0] - 2*margin, letter[1] - 2*margin, id='normal')
+        ]),
+    )
+
+def _metrics_table():
+    """Return a fresh metrics Table (flowables carry per-build layout state)"""
+    from reportlab.platypus import Table
+    styles = _get_styles()
+    tbl = Table(_METRICS_DATA, colWidths=styles.METRICS_COL_WIDTHS)
+    tbl.setStyle(styles.METRICS_STYLE)
+    return tbl
+
+def _qna_flowables():
+    """Yield section 1: questions asked and their answers"""
+    from reportlab.platypus import Paragraph
+    styles = _get_styles()
     # ===== SECTION 1: Q&A =====
-    story.append(Paragraph("1. Questions Asked & Comprehensive Answers", heading_style))
+    yield Paragraph("1. Questions Asked & Comprehensive Answers", styles.HEADING)
     
     # Q1
-    story.append(Paragraph("Q1: Error Suppression & SessionInfo Initialization Issues", subheading_style))
-    story.append(Paragraph("""
+    yield Paragraph("Q1: Error Suppression & SessionInfo Initialization Issues", styles.SUBHEADING)
+    yield Paragraph("""
     <b>Problem:</b> Application showing "Bad message format" and "SessionInfo before it was initialized" errors.<br/><br/>
     
     <b>Solution:</b><br/>
@@ -98,12 +227,12 @@ def create_learning_guide():
     • Maintained early session state initialization at module level<br/><br/>
     
     <b>Result:</b> Clean startup, no error messages, improved app performance.
-    """, normal_style))
-    story.append(Spacer(1, 0.15*inch))
+    """, styles.NORMAL)
+    yield styles.SPACER_MED
     
     # Q2
-    story.append(Paragraph("Q2: Transmitted Bits in Key Metrics Display", subheading_style))
-    story.append(Paragraph("""
+    yield Paragraph("Q2: Transmitted Bits in Key Metrics Display", styles.SUBHEADING)
+    yield Paragraph("""
     <b>Question:</b> Can we show transmitted bits in the key metrics?<br/><br/>
     
     <b>Answer:</b> Yes! Added two new metrics:<br/>
@@ -115,12 +244,12 @@ def create_learning_guide():
     • With Eve: May decrease below 50% due to eavesdropping errors<br/><br/>
     
     <b>Formula:</b> Sift Rate = (Sifted Bits / Transmitted Bits) × 100%
-    """, normal_style))
-    story.append(Spacer(1, 0.15*inch))
+    """, styles.NORMAL)
+    yield styles.SPACER_MED
     
     # Q3
-    story.append(Paragraph("Q3: Sifted Key Rate for Both Scenarios", subheading_style))
-    story.append(Paragraph("""
+    yield Paragraph("Q3: Sifted Key Rate for Both Scenarios", styles.SUBHEADING)
+    yield Paragraph("""
     <b>Question:</b> Add sifted key rate for both No Eve and With Eve scenarios.<br/><br/>
     
     <b>Implementation:</b><br/>
@@ -132,12 +261,12 @@ def create_learning_guide():
     <b>Calculation:</b><br/>
     Sift_Rate_No_Eve = (No_Eve_Sifted_Count / Transmitted_Bits) × 100%<br/>
     Sift_Rate_With_Eve = (With_Eve_Sifted_Count / Transmitted_Bits) × 100%
-    """, normal_style))
-    story.append(Spacer(1, 0.15*inch))
+    """, styles.NORMAL)
+    yield styles.SPACER_MED
     
     # Q4
-    story.append(Paragraph("Q4: Eve's Impact on Sifted Key Rate", subheading_style))
-    story.append(Paragraph("""
+    yield Paragraph("Q4: Eve's Impact on Sifted Key Rate", styles.SUBHEADING)
+    yield Paragraph("""
     <b>Question:</b> If Eve intercepts, does the sifted key decrease?<br/><br/>
     
     <b>Answer:</b> <b>YES!</b> Added three-column impact analysis:<br/>
@@ -151,12 +280,12 @@ def create_learning_guide():
     3. Eve re-sends corrupted qubits to Bob<br/>
     4. Alice-Bob basis matching faces additional errors<br/>
     5. Fewer bits pass verification → Lower sift rate
-    """, normal_style))
-    story.append(Spacer(1, 0.15*inch))
+    """, styles.NORMAL)
+    yield styles.SPACER_MED
     
     # Q5
-    story.append(Paragraph("Q5: What is Success Rate?", subheading_style))
-    story.append(Paragraph("""
+    yield Paragraph("Q5: What is Success Rate?", styles.SUBHEADING)
+    yield Paragraph("""
     <b>Definition:</b> Percentage of transmitted bits that were successfully sifted (basis-matched).<br/><br/>
     
     <b>Why ~50% in BB84?</b><br/>
@@ -170,12 +299,12 @@ def create_learning_guide():
     • Extra errors cause additional mismatches<br/>
     • Success rate may drop below 50%<br/>
     • Decrease reveals Eve's presence through QBER increase
-    """, normal_style))
-    story.append(Spacer(1, 0.15*inch))
+    """, styles.NORMAL)
+    yield styles.SPACER_MED
     
     # Q6
-    story.append(Paragraph("Q6: Color Legend for Metrics", subheading_style))
-    story.append(Paragraph("""
+    yield Paragraph("Q6: Color Legend for Metrics", styles.SUBHEADING)
+    yield Paragraph("""
     <b>Question:</b> Add color guide/legend for transmitted bits and success rate.<br/><br/>
     
     <b>Color Scheme:</b><br/>
@@ -186,12 +315,12 @@ def create_learning_guide():
     • <b>Green (#16a34a):</b> Eve undetected (low QBER)<br/><br/>
     
     <b>Visual Legend:</b> Three colored boxes showing meaning of each color.
-    """, normal_style))
-    story.append(Spacer(1, 0.15*inch))
+    """, styles.NORMAL)
+    yield styles.SPACER_MED
     
     # Q7
-    story.append(Paragraph("Q7: How Sifted Bits Are Lost to Eve", subheading_style))
-    story.append(Paragraph("""
+    yield Paragraph("Q7: How Sifted Bits Are Lost to Eve", styles.SUBHEADING)
+    yield Paragraph("""
     <b>Mechanism:</b><br/>
     1. Eve uses wrong basis: ~50% of Eve's choices don't match Alice's<br/>
     2. Wrong-basis measurement collapses quantum state incorrectly<br/>
@@ -203,12 +332,12 @@ def create_learning_guide():
     <b>Mathematical View:</b><br/>
     Bits_Lost = Sifted_No_Eve - Sifted_With_Eve<br/>
     Impact_Rate = (Bits_Lost / Sifted_No_Eve) × 100%
-    """, normal_style))
-    story.append(Spacer(1, 0.15*inch))
+    """, styles.NORMAL)
+    yield styles.SPACER_MED
     
     # Q8
-    story.append(Paragraph("Q8: Why Sifted Bits Lost Shows Zero", subheading_style))
-    story.append(Paragraph("""
+    yield Paragraph("Q8: Why Sifted Bits Lost Shows Zero", styles.SUBHEADING)
+    yield Paragraph("""
     <b>Possible Reasons:</b><br/>
     1. <b>Low Eve Probability:</b> If Eve Probability ≤ 50%, Eve doesn't intercept all qubits<br/>
     2. <b>Statistical Variance:</b> Eve's random basis sometimes aligns correctly with Alice<br/>
@@ -219,12 +348,12 @@ def create_learning_guide():
     • Increase Transmitted Bits to 500-2000<br/>
     • Run simulation multiple times (randomness matters)<br/>
     • Watch Eve's Impact Rate (%) instead of bit count
-    """, normal_style))
-    story.append(Spacer(1, 0.15*inch))
+    """, styles.NORMAL)
+    yield styles.SPACER_MED
     
     # Q9
-    story.append(Paragraph("Q9: Eve Detected Despite 0 Bits Lost", subheading_style))
-    story.append(Paragraph("""
+    yield Paragraph("Q9: Eve Detected Despite 0 Bits Lost", styles.SUBHEADING)
+    yield Paragraph("""
     <b>KEY INSIGHT: Eve is detected through QBER (error rate), NOT bit count!</b><br/><br/>
     
     <b>The Difference:</b><br/>
@@ -237,47 +366,37 @@ def create_learning_guide():
     
     <b>Why?</b> Eve's wrong-basis measurements introduce BIT FLIPS in the remaining sifted bits!<br/>
     These errors show up as QBER exceeding the threshold (typically 11%).
-    """, normal_style))
-    story.append(PageBreak())
-    
+    """, styles.NORMAL)
+
+def _formulas_flowables():
+    """Yield section 2: mathematical formulas and equations"""
+    from reportlab.platypus import Paragraph, Preformatted, Table
+    styles = _get_styles()
     # ===== SECTION 2: MATHEMATICAL FORMULAS =====
-    story.append(Paragraph("2. Mathematical Formulas & Equations", heading_style))
+    yield Paragraph("2. Mathematical Formulas & Equations", styles.HEADING)
     
     # BB84 Protocol Formulas
-    story.append(Paragraph("BB84 Protocol Mathematics", subheading_style))
-    
-    formulas = [
-        ("Sift Rate (Success Rate)", "Sift_Rate = (Sifted_Bits / Transmitted_Bits) × 100%", 
-         "Percentage of transmitted bits where Alice and Bob used same basis"),
-        
-        ("Expected Sift Rate (No Eve)", "Sift_Rate_Expected = 50%", 
-         "Since each person randomly chooses basis independently"),
-        
-        ("Sifted Key Rate", "Sifted_Rate = (Sifted_Count / Total_Transmitted) × 100%", 
-         "Shows efficiency for each scenario (No Eve vs With Eve)"),
-        
-        ("Eve's Impact on Sifting", "Impact = Sift_Rate_NoEve - Sift_Rate_WithEve", 
-         "Percentage point difference showing eavesdropping effect"),
-        
-        ("Bits Lost to Eve", "Bits_Lost = Sifted_Count_NoEve - Sifted_Count_WithEve", 
-         "Absolute count of sifted bits lost due to eavesdropping"),
-    ]
-    
-    for title, formula, desc in formulas:
-        story.append(Paragraph(f"<b>{title}:</b>", subheading_style))
-        story.append(Paragraph(formula, 
-                              ParagraphStyle('Formula', parent=styles['Normal'], 
-                                           fontName='Courier', fontSize=10, 
-                                           textColor=colors.HexColor('#1e40af'))))
-        story.append(Paragraph(f"<i>{desc}</i>", normal_style))
-        story.append(Spacer(1, 0.1*inch))
+    yield Paragraph("BB84 Protocol Mathematics", styles.SUBHEADING)
+    
+    # Preformatted skips the Paragraph markup parser; plain-text formulas are
+    # wrapped at spaces to fit the column
+    formula_rows = [["Quantity", "Formula", "Meaning"]]
+    formula_rows.extend(
+        [Paragraph(title, styles.SUBHEADING),
+         Preformatted(formula, styles.FORMULA, maxLineLength=36, splitChars=' ', newLineChars='    '),
+         Paragraph(f"<i>{desc}</i>", styles.NORMAL)]
+        for title, formula, desc in _FORMULAS
+    )
+    formula_tbl = Table(formula_rows, colWidths=styles.FORMULA_COL_WIDTHS)
+    formula_tbl.setStyle(styles.FORMULA_TABLE_STYLE)
+    yield formula_tbl
     
-    story.append(PageBreak())
+    yield styles.PAGE_BREAK
     
     # QBER Formulas
-    story.append(Paragraph("QBER (Quantum Bit Error Rate) Formulas", subheading_style))
+    yield Paragraph("QBER (Quantum Bit Error Rate) Formulas", styles.SUBHEADING)
     
-    story.append(Paragraph("""
+    yield Paragraph("""
     <b>Basic QBER Calculation:</b><br/>
     QBER = (Number_of_Errors / Total_Sifted_Bits) × 100%<br/><br/>
     
@@ -295,15 +414,14 @@ def create_learning_guide():
     <b>Detection Threshold:</b><br/>
     If QBER > Threshold → Eavesdropping Detected<br/>
     If QBER ≤ Threshold → Key is considered Secure ✅
-    """, normal_style))
+    """, styles.NORMAL)
     
-    story.append(Spacer(1, 0.15*inch))
-    story.append(PageBreak())
+    yield styles.PAGE_BREAK
     
     # Key Rate Formulas
-    story.append(Paragraph("Key Rate & Privacy Amplification", subheading_style))
+    yield Paragraph("Key Rate & Privacy Amplification", styles.SUBHEADING)
     
-    story.append(Paragraph("""
+    yield Paragraph("""
     <b>Key Rate (Efficiency):</b><br/>
     Key_Rate = (Final_Key_Length / Transmitted_Bits)<br/>
     Example: 25 bits final key / 200 transmitted = 0.125 = 12.5% efficiency<br/><br/>
@@ -320,15 +438,14 @@ def create_learning_guide():
     If QBER < threshold:<br/>
     Remaining_Eve_Info = 2^(-128) (exponentially small)<br/>
     Final key is cryptographically secure
-    """, normal_style))
+    """, styles.NORMAL)
     
-    story.append(Spacer(1, 0.15*inch))
-    story.append(PageBreak())
+    yield styles.PAGE_BREAK
     
     # Quantum State Formulas
-    story.append(Paragraph("Quantum State Mathematics", subheading_style))
+    yield Paragraph("Quantum State Mathematics", styles.SUBHEADING)
     
-    story.append(Paragraph("""
+    yield Paragraph("""
     <b>Z-Basis (Rectilinear) States:</b><br/>
     |0⟩_Z = |0⟩ (vertical polarization)<br/>
     |1⟩_Z = |1⟩ (horizontal polarization)<br/><br/>
@@ -343,15 +460,14 @@ def create_learning_guide():
     P(incorrect) = |⟨-|0⟩|² = (1/√2)² = 0.5 = 50%<br/><br/>
     
     <b>This is why Eve introduces errors!</b> Wrong basis measurement gives random result.
-    """, normal_style))
+    """, styles.NORMAL)
     
-    story.append(Spacer(1, 0.15*inch))
-    story.append(PageBreak())
+    yield styles.PAGE_BREAK
     
     # Bloch Sphere Formulas
-    story.append(Paragraph("Bloch Sphere Representation", subheading_style))
+    yield Paragraph("Bloch Sphere Representation", styles.SUBHEADING)
     
-    story.append(Paragraph("""
+    yield Paragraph("""
     <b>General Qubit State:</b><br/>
     |ψ⟩ = cos(θ/2)|0⟩ + e^(iφ)·sin(θ/2)|1⟩<br/><br/>
     
@@ -368,44 +484,28 @@ def create_learning_guide():
     |1⟩ → (0, 0, -1) - South pole (Z-basis)<br/>
     |+⟩ → (1, 0, 0) - +X axis (X-basis)<br/>
     |-⟩ → (-1, 0, 0) - -X axis (X-basis)
-    """, normal_style))
-    
-    story.append(PageBreak())
-    
+    """, styles.NORMAL)
+
+def _concepts_flowables():
+    """Yield section 3: key concepts explained"""
+    from reportlab.platypus import Paragraph
+    styles = _get_styles()
     # ===== SECTION 3: KEY CONCEPTS =====
-    story.append(Paragraph("3. Key Concepts Explained", heading_style))
-    
-    concepts = [
-        ("Basis Matching", 
-         "When Alice's basis equals Bob's basis for a particular qubit. Essential for BB84 sifting."),
-        
-        ("Sifting", 
-         "Process of keeping only bits where Alice and Bob used the same measurement basis."),
-        
-        ("Eavesdropping Detection",
-         "Detected through QBER (error rate), not through missing bits. Eve's measurements introduce errors."),
-        
-        ("Quantum Measurement",
-         "Collapses superposition to definite state. Measuring in wrong basis gives random result."),
-        
-        ("Quantum Uncertainty",
-         "Cannot know arbitrary observable of quantum state without destroying it (Heisenberg principle)."),
-        
-        ("Information-Theoretic Security",
-         "Security guaranteed by laws of physics, not computational complexity. Eve gains negligible information."),
-    ]
-    
-    for concept, explanation in concepts:
-        story.append(Paragraph(f"<b>{concept}:</b> {explanation}", normal_style))
-        story.append(Spacer(1, 0.08*inch))
-    
-    story.append(PageBreak())
+    yield Paragraph("3. Key Concepts Explained", styles.HEADING)
     
+    yield Paragraph("<br/><br/>".join(
+        f"<b>{concept}:</b> {explanation}" for concept, explanation in _CONCEPTS
+    ), styles.NORMAL)
+
+def _practical_flowables():
+    """Yield section 4: practical implementation details and footer"""
+    from reportlab.platypus import Paragraph
+    styles = _get_styles()
     # ===== SECTION 4: PRACTICAL DETAILS =====
-    story.append(Paragraph("4. Practical Implementation Details", heading_style))
+    yield Paragraph("4. Practical Implementation Details", styles.HEADING)
     
-    story.append(Paragraph("Simulation Parameters", subheading_style))
-    story.append(Paragraph("""
+    yield Paragraph("Simulation Parameters", styles.SUBHEADING)
+    yield Paragraph("""
     <b>Transmitted Bits (qubits):</b> 50-2000 (configurable)<br/>
     Range determines sample size for statistical analysis.<br/><br/>
     
@@ -420,52 +520,121 @@ def create_learning_guide():
     
     <b>Eve Attack Type:</b> Intercept-Resend (default)<br/>
     Eve measures and re-transmits, introducing detectable errors.
-    """, normal_style))
-    
-    story.append(Spacer(1, 0.15*inch))
+    """, styles.NORMAL)
     
-    story.append(Paragraph("Metrics Explained", subheading_style))
+    yield styles.SPACER_MED
     
-    metrics_data = [
-        ["Metric", "Formula", "Meaning"],
-        ["Transmitted", "num_bits", "Total qubits sent"],
-        ["Sift Rate", "(sifted/transmitted)×100%", "Success in basis matching"],
-        ["Sifted Bits", "count where basis match", "Usable bits for key"],
-        ["Errors", "sifted_bits - correct_bits", "Mismatches in sifted bits"],
-        ["QBER", "(errors/sifted)×100%", "Error rate indicator"],
-        ["Final Key", "privacy_amplify(sifted)", "Cryptographically secure key"],
-        ["Key Rate", "final_key/transmitted", "Protocol efficiency"],
-    ]
+    yield Paragraph("Metrics Explained", styles.SUBHEADING)
     
-    tbl = Table(metrics_data, colWidths=[1.5*inch, 2.0*inch, 2.5*inch])
-    tbl.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2563eb')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e0e7ff')),
-        ('FONTSIZE', (0, 1), (-1, -1), 8),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')]),
-    ]))
-    story.append(tbl)
+    yield _metrics_table()
     
-    story.append(Spacer(1, 0.3*inch))
+    yield styles.SPACER_LARGE
     
     # Footer
-    story.append(Paragraph("=" * 80, normal_style))
-    story.append(Paragraph("End of Learning Guide", 
-                          ParagraphStyle('Footer', parent=styles['Normal'], 
-                                       alignment=TA_CENTER, fontSize=10)))
+    yield from styles.FOOTER_FLOWABLES
+
+# Top-level sections, each starting on a fresh page
+_SECTION_BUILDERS = (
+    _qna_flowables,
+    _formulas_flowables,
+    _concepts_flowables,
+    _practical_flowables,
+)
+
+_TODAY = None
+_TODAY_STR = None
+
+def _today_str():
+    """Return today's formatted date, re-running strftime only when the day changes"""
+    global _TODAY, _TODAY_STR
+    today = date.today()
+    if today != _TODAY:
+        _TODAY, _TODAY_STR = today, today.strftime('%B %d, %Y')
+    return _TODAY_STR
+
+def _title_flowables(date_str):
+    """Yield the title page heading (only the timestamp changes between calls)"""
+    from reportlab.platypus import Paragraph
+    styles = _get_styles()
+    yield Paragraph("BB84 Quantum Key Distribution", styles.TITLE)
+    yield Paragraph("Complete Learning Guide", styles.TITLE)
+    yield styles.SPACER_LARGE
+    yield Paragraph(f"Generated: {date_str}", styles.NORMAL)
+
+def _front_matter_flowables():
+    """Yield the static title-page tail and table of contents"""
+    from reportlab.platypus import Paragraph
+    styles = _get_styles()
+    yield Paragraph("JNTUA ECE Department | Team Silicon", styles.NORMAL)
+    yield styles.PAGE_BREAK
     
-    # Build PDF
-    doc.build(story)
-    print(f"\n✅ PDF Generated: {filename}")
-    print(f"📁 Location: /home/keerthan/Desktop/bb84_2/{filename}")
-    return filename
+    # Table of Contents
+    yield Paragraph("Table of Contents", styles.HEADING)
+    yield Paragraph("<br/>".join(_TOC_ITEMS), styles.NORMAL)
+
+@lru_cache(maxsize=1)
+def _build_static_story():
+    """Build the static guide flowables once and reuse them on every call.
+
+    Everything after the "Generated" timestamp is fixed content, so the
+    Paragraph markup is parsed a single time per process. Callers must copy
+    the flowables before building since ReportLab mutates layout state.
+    """
+    page_break = _get_styles().PAGE_BREAK
+    sections = (itertools.chain((page_break,), build_section())
+                for build_section in _SECTION_BUILDERS)
+    return tuple(itertools.chain(_front_matter_flowables(),
+                                 itertools.chain.from_iterable(sections)))
+
+def _guide_doc_template(filename):
+    """Return a letter-size guide document that reuses the shared page template"""
+    from reportlab.platypus import BaseDocTemplate
+    styles = _get_styles()
+    # Deterministic content streams (ReportLab compresses pages by default)
+    doc = BaseDocTemplate(filename, pagesize=styles.PAGESIZE,
+                          rightMargin=styles.MARGIN, leftMargin=styles.MARGIN,
+                          topMargin=styles.MARGIN, bottomMargin=styles.MARGIN,
+                          invariant=1)
+    doc.addPageTemplates([styles.PAGE_TEMPLATE])
+    return doc
+
+@lru_cache(maxsize=1)
+def _render_learning_guide(date_str):
+    """Lay out the learning guide with ReportLab and return the PDF bytes
+
+    The PDF only depends on the date, so repeat calls on the same day reuse
+    the bytes from the first build in this process.
+    """
+    # ReportLab marks flowables with layout state (e.g. _postponed) during
+    # build, so hand it shallow copies that still share parsed frags.
+    buffer = io.BytesIO()
+    _guide_doc_template(buffer).build(list(itertools.chain(
+        _title_flowables(date_str),
+        (copy.copy(flowable) for flowable in _build_static_story()))))
+    return buffer.getvalue()
+
+def create_learning_guide(output=None):
+    """Create comprehensive BB84 learning guide with Q&A and formulas
+    
+    Args:
+        output: Optional file-like object (e.g. io.BytesIO) to stream the PDF
+            into instead of writing BB84_Complete_Learning_Guide.pdf
+    
+    Returns:
+        The output file-like object if given, otherwise the PDF filename
+    """
+    
+    pdf_bytes = _render_learning_guide(_today_str())
+    
+    if output is not None:
+        output.write(pdf_bytes)
+        return output
+    with open(PDF_FILENAME, 'wb') as pdf_file:
+        pdf_file.write(pdf_bytes)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("PDF Generated: %s", os.path.abspath(PDF_FILENAME))
+    return PDF_FILENAME
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     create_learning_guide()
@@ -4,70 +4,121 @@ Enhanced BB84 Implementation Guide with code snippets and technical deep-dives.
 Creates a second PDF with additional technical content for advanced judges.
 """
 
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle, Preformatted
-from reportlab.lib import colors
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
 from datetime import datetime
+from functools import cache
+import io
+import itertools
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, wait
+from types import SimpleNamespace
+from typing import Final
+import copy
 
-def create_advanced_guide():
-    """Create advanced technical guide with code snippets"""
-    
-    pdf_path = "/home/keerthan/Desktop/bb84_2/BB84_Advanced_Technical_Guide.pdf"
-    doc = SimpleDocTemplate(pdf_path, pagesize=A4,
-                           rightMargin=0.6*inch, leftMargin=0.6*inch,
-                           topMargin=0.6*inch, bottomMargin=0.6*inch)
-    
-    styles = getSampleStyleSheet()
-    
-    title_style = ParagraphStyle(
-        'Title', parent=styles['Heading1'], fontSize=24, 
-        textColor=colors.HexColor('#1e40af'), spaceAfter=20, alignment=TA_CENTER, fontName='Helvetica-Bold'
-    )
-    
-    heading_style = ParagraphStyle(
-        'Heading', parent=styles['Heading2'], fontSize=13,
-        textColor=colors.HexColor('#1e40af'), spaceAfter=10, fontName='Helvetica-Bold'
-    )
+from bb84_guide_utils import lazy_getattr, static_paragraph
+
+# Public names built by _get_reportlab() and served through __getattr__
+_LAZY_NAMES = frozenset({
+    'TITLE_STYLE', 'SUBTITLE_STYLE', 'DATE_STYLE', 'HEADING_STYLE',
+    'SUBHEADING_STYLE', 'CODE_STYLE', 'NORMAL_STYLE', 'FastCodeBlock',
+})
+
+@cache
+def _get_reportlab():
+    """Import ReportLab and build the guide's styles and code flowable on first use.
+
+    Importing this module (e.g. from the Streamlit app) stays cheap; ReportLab
+    is only loaded when a guide is actually generated.
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+    from reportlab.lib.styles import ParagraphStyle
+    from reportlab.platypus import Flowable
+    
+    # Parents matching the sample stylesheet entries this guide builds on,
+    # without constructing the whole sample sheet
+    normal = ParagraphStyle('Normal', fontName='Helvetica', fontSize=10, leading=12)
+    h1 = ParagraphStyle('Heading1', parent=normal, fontName='Helvetica-Bold', fontSize=18, leading=22,
+                        spaceAfter=6)
+    h2 = ParagraphStyle('Heading2', parent=normal, fontName='Helvetica-Bold', fontSize=14, leading=18,
+                        spaceBefore=12, spaceAfter=6)
     
     code_style = ParagraphStyle(
-        'Code', parent=styles['Normal'], fontName='Courier', fontSize=8,
+        'Code', parent=normal, fontName='Courier', fontSize=8,
         textColor=colors.HexColor('#1f2937'), backColor=colors.HexColor('#f3f4f6'),
         leftIndent=12, spaceAfter=8, leading=10
     )
     
-    normal = ParagraphStyle(
-        'Normal', parent=styles['Normal'], fontSize=9.5, alignment=TA_JUSTIFY, spaceAfter=8
+    class FastCodeBlock(Flowable):
+        """Code listing drawn as one text object, one line per row.
+
+        Code is never wrapped, so the height is simply lines * leading and page
+        splits just slice the line list (Preformatted re-joins and re-dedents
+        the text on every split).
+        """
+
+        def __init__(self, lines, style=code_style):
+            Flowable.__init__(self)
+            self.lines = lines
+            self.style = style
+            self.leading = style.leading
+
+        def wrap(self, availWidth, availHeight):
+            self.width = availWidth
+            self.height = len(self.lines) * self.leading
+            return self.width, self.height
+
+        def split(self, availWidth, availHeight):
+            n_fit = int(availHeight // self.leading)
+            if n_fit <= 0:
+                return []
+            return [FastCodeBlock(self.lines[:n_fit], self.style),
+                    FastCodeBlock(self.lines[n_fit:], self.style)]
+
+        def draw(self):
+            style = self.style
+            if style.backColor is not None:
+                self.canv.setFillColor(style.backColor)
+                self.canv.rect(0, 0, self.width, self.height, stroke=0, fill=1)
+            self.canv.setFillColor(style.textColor)
+            text = self.canv.beginText(style.leftIndent, self.height - style.fontSize)
+            text.setFont(style.fontName, style.fontSize, self.leading)
+            text.textLines(self.lines, trim=0)
+            self.canv.drawText(text)
+    
+    # Paragraph styles (built once per process and shared by every call)
+    return SimpleNamespace(
+        TITLE_STYLE=ParagraphStyle(
+            'Title', parent=h1, fontSize=24, 
+            textColor=colors.HexColor('#1e40af'), spaceAfter=20, alignment=TA_CENTER, fontName='Helvetica-Bold'
+        ),
+        SUBTITLE_STYLE=ParagraphStyle(
+            'subtitle', parent=normal, fontSize=11,
+            textColor=colors.HexColor('#666'), alignment=TA_CENTER
+        ),
+        DATE_STYLE=ParagraphStyle(
+            'date', parent=normal, fontSize=8.5,
+            textColor=colors.HexColor('#999'), alignment=TA_CENTER
+        ),
+        HEADING_STYLE=ParagraphStyle(
+            'Heading', parent=h2, fontSize=13,
+            textColor=colors.HexColor('#1e40af'), spaceAfter=10, fontName='Helvetica-Bold'
+        ),
+        SUBHEADING_STYLE=ParagraphStyle(
+            'subheading', parent=normal, fontSize=10, fontName='Helvetica-Bold', spaceAfter=6
+        ),
+        CODE_STYLE=code_style,
+        NORMAL_STYLE=ParagraphStyle(
+            'Normal', parent=normal, fontSize=9.5, alignment=TA_JUSTIFY, spaceAfter=8
+        ),
+        FastCodeBlock=FastCodeBlock,
     )
-    
-    story = []
-    
-    # Title
-    story.append(Spacer(1, 0.5*inch))
-    story.append(Paragraph("BB84 Advanced Technical Implementation", title_style))
-    story.append(Paragraph("Code Walkthroughs & Architecture Deep-Dive", 
-                          ParagraphStyle('subtitle', parent=styles['Normal'], fontSize=11, 
-                                       textColor=colors.HexColor('#666'), alignment=TA_CENTER)))
-    story.append(Spacer(1, 0.3*inch))
-    story.append(Paragraph(f"Generated: {datetime.now().strftime('%B %d, %Y at %H:%M:%S UTC')}", 
-                          ParagraphStyle('date', parent=styles['Normal'], fontSize=8.5, 
-                                       textColor=colors.HexColor('#999'), alignment=TA_CENTER)))
-    story.append(PageBreak())
-    
-    # ===== QUANTUM ENCODING =====
-    story.append(Paragraph("1. Quantum Bit Encoding (Core Algorithm)", heading_style))
-    
-    story.append(Paragraph("""
-    The encode_qubit() function is the heart of BB84. It creates quantum circuits that encode classical 
-    bits using quantum gates. The function must support two bases: Z-basis (rectilinear) and X-basis (diagonal).
-    """, normal))
-    
-    story.append(Paragraph("Code Implementation:", ParagraphStyle('subheading', parent=styles['Normal'], 
-                                                                 fontSize=10, fontName='Helvetica-Bold', spaceAfter=6)))
-    
-    code1 = """def encode_qubit(bit: int, basis: int) -> QuantumCircuit:
+
+# The public styles and FastCodeBlock import ReportLab on first access
+__getattr__ = lazy_getattr(__name__, _LAZY_NAMES, _get_reportlab)
+
+# Code listings reproduced in the guide (interned once at import)
+_CODE_ENCODE_QUBIT: Final[str] = """def encode_qubit(bit: int, basis: int) -> QuantumCircuit:
     \"\"\"
     Encode a classical bit into a quantum circuit using specified basis.
     
@@ -103,27 +154,22 @@ def create_advanced_guide():
 # Quantum state details:
 # Z-basis: |0⟩ is north pole (0°), |1⟩ is south pole (180°)
 # X-basis: |+⟩ = (|0⟩+|1⟩)/√2 is east (90°), |-⟩ = (|0⟩-|1⟩)/√2 is west (270°)"""
-    
-    story.append(Preformatted(code1, code_style))
-    
-    story.append(Paragraph("""
-    <b>Key Points:</b><br/>
-    • Z-basis uses computational basis directly (fast, no additional gates)<br/>
-    • X-basis uses Hadamard gate H = (1/√2)[[1,1],[1,-1]] for 45° rotation<br/>
-    • Measurement in wrong basis yields random result (50% for each outcome)<br/>
-    • This randomness is crucial for BB84's security
-    """, normal))
-    story.append(PageBreak())
-    
-    # ===== SIMULATION FLOW =====
-    story.append(Paragraph("2. Quantum Transmission Simulation", heading_style))
-    
-    story.append(Paragraph("""
-    The simulate_transmission() function orchestrates the entire BB84 protocol. It handles Alice's 
-    encoding, quantum channel transmission, Bob's measurement, and optional Eve's eavesdropping.
-    """, normal))
-    
-    code2 = """def simulate_transmission(self, alice_bits, alice_bases, bob_bases, 
+
+_CODE_TRANSMISSION: Final[str] = """def measure_in_basis(qc, basis):
+    \"\"\"Append a measurement in the Z-basis (0) or X-basis (1)\"\"\"
+    if basis == 1:  # X-basis requires Hadamard before measurement
+        qc.h(0)
+    qc.measure(0, 0)
+    return qc
+
+def run_batch(self, circuits):
+    \"\"\"Run all circuits in ONE Aer job and return each single-shot outcome\"\"\"
+    result = self.simulator.run(circuits, shots=1).result()
+    return np.fromiter((int(next(iter(result.get_counts(i))))
+                        for i in range(len(circuits))),
+                       dtype=np.uint8, count=len(circuits))
+
+def simulate_transmission(self, alice_bits, alice_bases, bob_bases, 
                            eve_present=False, eve_intercept_prob=1.0):
     \"\"\"
     Simulate BB84 quantum transmission with optional eavesdropping.
@@ -137,78 +183,76 @@ def create_advanced_guide():
     
     Returns:
         bob_results: Bob's measurement results
-        eve_results: Eve's measurement results (or None if eve_present=False)
+        eve_results: Eve's results for the qubits she intercepted
+                     (or None if eve_present=False)
     \"\"\"
     
     n_qubits = len(alice_bits)
-    bob_results = []
-    eve_results = eve_present and [] or None
-    
-    # Process each qubit
-    for i in range(n_qubits):
-        # Step 1: Alice encodes her bit into quantum circuit
-        alice_bit = int(alice_bits[i])
-        alice_basis = int(alice_bases[i])
-        qc = self.encode_qubit(alice_bit, alice_basis)
-        
-        # Step 2: (Optional) Eve measures and re-transmits
-        if eve_present:
-            eve_basis = np.random.randint(0, 2)  # Eve guesses randomly
-            
-            # Eve performs measurement in her chosen basis
-            eve_qc = qc.copy()
-            if eve_basis == 0:  # Z-basis measurement
-                eve_qc.measure(0, 0)
-            else:  # X-basis requires Hadamard before measurement
-                eve_qc.h(0)
-                eve_qc.measure(0, 0)
-            
-            # Get Eve's result
-            job = self.simulator.run(eve_qc, shots=1)
-            eve_measurement = int(job.result().get_counts().most_common(1)[0][0])
-            eve_results.append(eve_measurement)
-            
-            # Eve re-encodes her measurement result
-            # This is where error gets introduced if Eve measured in wrong basis
-            qc = self.encode_qubit(eve_measurement, eve_basis)
-        
-        # Step 3: Bob measures in his chosen basis
-        bob_basis = int(bob_bases[i])
-        bob_qc = qc.copy()
+    sent_bits = np.array(alice_bits, dtype=np.uint8)
+    sent_bases = np.array(alice_bases, dtype=np.uint8)
+    eve_results = None
+    
+    # Phase 1 (optional): Eve measures every intercepted qubit, in one job
+    if eve_present:
+        eve_bases = np.random.randint(0, 2, n_qubits)  # Eve guesses randomly
+        intercepted = np.flatnonzero(np.random.random(n_qubits) < eve_intercept_prob)
+        eve_results = self.run_batch([
+            measure_in_basis(self.encode_qubit(sent_bits[i], sent_bases[i]), eve_bases[i])
+            for i in intercepted
+        ])
         
-        if bob_basis == 0:  # Z-basis measurement
-            bob_qc.measure(0, 0)
-        else:  # X-basis requires Hadamard before measurement
-            bob_qc.h(0)
-            bob_qc.measure(0, 0)
-        
-        # Execute measurement
-        job = self.simulator.run(bob_qc, shots=1)
-        bob_measurement = int(job.result().get_counts().most_common(1)[0][0])
-        bob_results.append(bob_measurement)
-    
-    return np.array(bob_results), eve_results and np.array(eve_results) or None"""
-    
-    story.append(Preformatted(code2, code_style))
-    
-    story.append(Paragraph("""
-    <b>Security Mechanism:</b><br/>
-    When Eve measures in the wrong basis, she gets a random result (50% correct, 50% wrong). 
-    Even if she re-prepares the state based on her result, Bob will see an increased error rate 
-    when his basis matches Alice's but differs from Eve's choice.
-    """, normal))
-    story.append(PageBreak())
+        # Eve re-encodes her results in her own bases
+        # This is where error gets introduced if Eve measured in wrong basis
+        sent_bits[intercepted] = eve_results
+        sent_bases[intercepted] = eve_bases[intercepted]
+    
+    # Phase 2: Bob measures every qubit in his chosen basis, in one job
+    # (one Python<->C++ round trip instead of one per qubit)
+    bob_results = self.run_batch([
+        measure_in_basis(self.encode_qubit(sent_bits[i], sent_bases[i]), bob_bases[i])
+        for i in range(n_qubits)
+    ])
+    
+    return bob_results, eve_results"""
+
+_CODE_ANALYTIC_KERNEL: Final[str] = """def simulate_bb84(alice_bits, alice_bases, bob_bases, eve_bases=None, rng=None):
+    \"\"\"
+    Analytic BB84 kernel: same outcome statistics as the Qiskit circuits,
+    without building or simulating a single circuit.
     
-    # ===== PRIVACY AMPLIFICATION =====
-    story.append(Paragraph("3. Privacy Amplification (SHA-256/512)", heading_style))
+    A BB84 state measured in its own basis returns the encoded bit;
+    measured in the other basis it returns a fair coin flip.
     
-    story.append(Paragraph("""
-    Privacy amplification extracts a secure key from the sifted key using cryptographic hashing. 
-    The algorithm ensures that even if Eve has partial information, the final key is secure.
-    """, normal))
+    Args:
+        alice_bits, alice_bases, bob_bases: uint8 arrays of 0/1
+        eve_bases: Eve's basis per qubit, or None when there is no Eve
+        rng: Seed or numpy Generator for the coin flips
     
-    code3 = """import hashlib
+    Returns:
+        bob_results, eve_results (None when there is no Eve)
+    \"\"\"
+    rng = np.random.default_rng(rng)
+    n = len(alice_bits)
+    bits = np.asarray(alice_bits, dtype=np.uint8)
+    bases = np.asarray(alice_bases, dtype=np.uint8)
+    eve_results = None
+    
+    if eve_bases is not None:
+        eve_bases = np.asarray(eve_bases, dtype=np.uint8)
+        coins = rng.integers(0, 2, n, dtype=np.uint8)
+        eve_results = np.where(eve_bases == bases, bits, coins)
+        # Eve re-sends what she measured, prepared in her own basis
+        bits, bases = eve_results, eve_bases
+    
+    coins = rng.integers(0, 2, n, dtype=np.uint8)
+    bob_bases = np.asarray(bob_bases, dtype=np.uint8)
+    bob_results = np.where(bob_bases == bases, bits, coins)
+    
+    return bob_results, eve_results"""
+
+_CODE_PRIVACY_AMPLIFICATION: Final[str] = """import hashlib
 from math import log2
+import numpy as np
 
 def privacy_amplification(self, sifted_key, error_rate, 
                         target_security_level=128):
@@ -245,54 +289,46 @@ def privacy_amplification(self, sifted_key, error_rate,
     secure_length = int(n * (1 - h_eve) - 2 * log2(1 / eps))
     secure_length = max(0, secure_length)  # Ensure non-negative
     
-    # Convert sifted key to binary string for hashing
-    key_string = ''.join(str(int(bit)) for bit in sifted_key)
-    key_bytes = key_string.encode('utf-8')
+    # Encode the key as '0'/'1' bytes for hashing (one numpy pass)
+    key_bits = np.asarray(sifted_key, dtype=np.uint8)
+    key_bytes = (key_bits + ord('0')).tobytes()
     
     # Primary hash: SHA-256 (produces 256-bit output)
-    sha256_digest = hashlib.sha256(key_bytes).hexdigest()
-    sha256_binary = bin(int(sha256_digest, 16))[2:].zfill(256)
+    # unpackbits expands the raw digest to bits in C, MSB first
+    sha256_bits = np.unpackbits(np.frombuffer(hashlib.sha256(key_bytes).digest(), dtype=np.uint8))
     
     # Secondary hash: SHA-512 (if secure_length > 256)
     if secure_length > 256:
-        sha512_digest = hashlib.sha512(key_bytes).hexdigest()
-        sha512_binary = bin(int(sha512_digest, 16))[2:].zfill(512)
+        sha512_bits = np.unpackbits(np.frombuffer(hashlib.sha512(key_bytes).digest(), dtype=np.uint8))
         # Concatenate SHA-256 and SHA-512 outputs
-        combined_binary = sha256_binary + sha512_binary
+        combined_bits = np.concatenate([sha256_bits, sha512_bits])
     else:
-        combined_binary = sha256_binary
+        combined_bits = sha256_bits
     
     # Extract exactly secure_length bits from hash output
-    final_key_bits = [int(b) for b in combined_binary[:secure_length]]
-    
-    return final_key_bits
+    return combined_bits[:secure_length].tolist()
 
 # Security Properties Guaranteed:
 # 1. Preimage Resistance: Cannot find input for given SHA output
 # 2. Collision Resistance: Negligible probability of two inputs = same hash
 # 3. Avalanche Effect: 1-bit input change completely changes output
 # 4. Information Concentration: Eve's leakage about input doesn't leak final key"""
-    
-    story.append(Preformatted(code3, code_style))
-    
-    story.append(Paragraph("""
-    <b>Mathematical Security:</b><br/>
-    The key length formula ensures exponentially small probability (2^-128) that Eve can guess the final key, 
-    even with partial information quantified by QBER. This is information-theoretic security.
-    """, normal))
-    story.append(PageBreak())
-    
-    # ===== BLOCH SPHERE CODE =====
-    story.append(Paragraph("4. Bloch Sphere Visualization Implementation", heading_style))
-    
-    story.append(Paragraph("""
-    The Bloch sphere visualization converts quantum statevectors to 3D coordinates for interactive visualization.
-    """, normal))
-    
-    code4 = """import numpy as np
-from numpy import sin, cos, linspace, outer, pi, arccos, angle
+
+_CODE_BLOCH_SPHERE: Final[str] = """import numpy as np
+from numpy import sin, cos, linspace, outer, ones, pi, arccos, angle
 import plotly.graph_objects as go
 
+# Sphere surface mesh, built once at import and shared by every figure
+# (30x30 grid: smooth at 15% opacity, 2.8x fewer faces than 50x50)
+u = linspace(0, 2*pi, 30)  # Azimuthal angle
+v = linspace(0, pi, 30)    # Polar angle
+
+# Spherical to Cartesian coordinates
+# x = sin(v)*cos(u), y = sin(v)*sin(u), z = cos(v)
+SPHERE_X = outer(cos(u), sin(v))
+SPHERE_Y = outer(sin(u), sin(v))
+SPHERE_Z = outer(ones(len(u)), cos(v))
+
 def plotly_bloch_sphere(states, title="Bloch Sphere"):
     \"\"\"
     Create interactive 3D Bloch sphere visualization of quantum states.
@@ -305,22 +341,12 @@ def plotly_bloch_sphere(states, title="Bloch Sphere"):
         plotly.graph_objects.Figure: Interactive 3D Bloch sphere
     \"\"\"
     
-    # Create sphere surface mesh (50x50 grid)
-    u = linspace(0, 2*pi, 50)  # Azimuthal angle
-    v = linspace(0, pi, 50)     # Polar angle
-    
-    # Spherical to Cartesian coordinates
-    # x = sin(v)*cos(u), y = sin(v)*sin(u), z = cos(v)
-    x_sphere = outer(cos(u), sin(v))
-    y_sphere = outer(sin(u), sin(v))
-    z_sphere = outer(ones(len(u)), cos(v))
-    
     # Create figure
     fig = go.Figure()
     
-    # Add semi-transparent sphere
+    # Add semi-transparent sphere (precomputed mesh)
     fig.add_trace(go.Surface(
-        x=x_sphere, y=y_sphere, z=z_sphere,
+        x=SPHERE_X, y=SPHERE_Y, z=SPHERE_Z,
         opacity=0.15, colorscale='Blues',
         showscale=False, hoverinfo='skip'
     ))
@@ -352,24 +378,24 @@ def plotly_bloch_sphere(states, title="Bloch Sphere"):
     # Color palette for multiple states
     colors_palette = ['orange', 'purple', 'cyan', 'magenta', 'yellow', 'lime']
     
+    # Extract all amplitudes at once: row k is ψ_k = [a, b] = [⟨0|ψ⟩, ⟨1|ψ⟩]
+    data = np.stack([statevector.data for statevector in states])
+    a, b = data[:, 0], data[:, 1]
+    
+    # Convert every statevector to Bloch coordinates in one numpy pass
+    # θ = 2*arccos(|⟨0|ψ⟩|)
+    thetas = 2 * arccos(np.clip(np.abs(a), 0, 1))
+    
+    # φ = arg(⟨1|ψ⟩) - arg(⟨0|ψ⟩)
+    phis = angle(b) - angle(a)
+    
+    # Spherical to Cartesian
+    xs = sin(thetas) * cos(phis)
+    ys = sin(thetas) * sin(phis)
+    zs = cos(thetas)
+    
     # Add quantum states as points on Bloch sphere
-    for idx, statevector in enumerate(states):
-        # Extract amplitudes: ψ = [a, b] = [⟨0|ψ⟩, ⟨1|ψ⟩]
-        data = statevector.data
-        a, b = data[0], data[1]
-        
-        # Convert statevector to Bloch coordinates
-        # θ = 2*arccos(|⟨0|ψ⟩|)
-        theta = 2 * arccos(np.clip(np.abs(a), 0, 1))
-        
-        # φ = arg(⟨1|ψ⟩) - arg(⟨0|ψ⟩)
-        phi = angle(b) - angle(a)
-        
-        # Spherical to Cartesian
-        x_point = sin(theta) * cos(phi)
-        y_point = sin(theta) * sin(phi)
-        z_point = cos(theta)
-        
+    for idx, (theta, phi, x_point, y_point, z_point) in enumerate(zip(thetas, phis, xs, ys, zs)):
         # Add state point
         color = colors_palette[idx % len(colors_palette)]
         fig.add_trace(go.Scatter3d(
@@ -402,26 +428,8 @@ def plotly_bloch_sphere(states, title="Bloch Sphere"):
     )
     
     return fig"""
-    
-    story.append(Preformatted(code4, code_style))
-    
-    story.append(Paragraph("""
-    <b>Visualization Details:</b><br/>
-    • Bloch coordinates: θ ∈ [0,π] (polar), φ ∈ [0,2π] (azimuthal)<br/>
-    • Sphere radius = 1.0 (normalized unit sphere)<br/>
-    • State vectors shown as colored diamonds with connecting lines<br/>
-    • Interactive features: 3D rotation, zoom, hover information
-    """, normal))
-    story.append(PageBreak())
-    
-    # ===== STREAMLIT FRONTEND =====
-    story.append(Paragraph("5. Streamlit Frontend Architecture", heading_style))
-    
-    story.append(Paragraph("""
-    The main application uses Streamlit for reactive UI with session state management.
-    """, normal))
-    
-    code5 = """import streamlit as st
+
+_CODE_STREAMLIT_APP: Final[str] = """import streamlit as st
 from streamlit_option_menu import option_menu
 
 # Initialize session state early (prevents SessionInfo errors)
@@ -448,13 +456,6 @@ st.markdown(\"\"\"
     [data-testid="stSidebar"] { background-color: #f8f9fa !important; }
     .css-1kyxreq { color: #1a1a1a !important; }
     </style>
-    <script>
-    function force_light_theme() {
-        document.documentElement.setAttribute('data-color-mode', 'light');
-        localStorage.setItem('streamlit_theme', 'light');
-    }
-    force_light_theme();
-    </script>
 \"\"\", unsafe_allow_html=True)
 
 # Sidebar controls
@@ -508,11 +509,25 @@ with col1:
             st.session_state.simulation_completed = True
             st.session_state.simulation_in_progress = False
 
+# Streamlit reruns the whole script on every widget change, so expensive
+# per-simulation artifacts are cached on their (content-hashed) inputs
+@st.cache_data
+def build_timeline(alice_bits, alice_bases, bob_bases, bob_results):
+    return create_transmission_timeline(alice_bits, alice_bases, bob_bases, bob_results)
+
+@st.cache_data
+def build_bloch_figure(qubits, bits, bases):
+    return plotly_bloch_sphere(
+        [get_statevector_from_bit_basis(q, bit, basis)
+         for q, bit, basis in zip(qubits, bits, bases)],
+        title="BB84 Quantum States on Bloch Sphere"
+    )
+
 # Display results when simulation complete
 if st.session_state.simulation_completed and st.session_state.sim_results:
     with tab1:
         st.subheader("Qubit-by-Qubit Timeline")
-        timeline_df = create_transmission_timeline(
+        timeline_df = build_timeline(
             st.session_state.sim_results['alice_bits'],
             st.session_state.sim_results['alice_bases'],
             st.session_state.sim_results['bob_bases'],
@@ -529,99 +544,264 @@ if st.session_state.simulation_completed and st.session_state.sim_results:
             default=list(range(min(num_bits, 4)))
         )
         
-        # Create Bloch sphere figure
-        bloch_fig = plotly_bloch_sphere(
-            [get_statevector_from_bit_basis(q, alice_bits[q], alice_bases[q])
-             for q in selected_qubits],
-            title="BB84 Quantum States on Bloch Sphere"
+        # Create Bloch sphere figure (recomputed only when the selection changes)
+        bloch_fig = build_bloch_figure(
+            tuple(selected_qubits),
+            tuple(int(alice_bits[q]) for q in selected_qubits),
+            tuple(int(alice_bases[q]) for q in selected_qubits)
         )
         st.plotly_chart(bloch_fig, use_container_width=True)"""
+
+# Written to the current working directory unless a path is given
+DEFAULT_PDF_PATH = "BB84_Advanced_Technical_Guide.pdf"
+
+def _render_advanced_guide(generated_at):
+    """Lay out the advanced guide with ReportLab and return the PDF bytes"""
+    
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
+    rl = _get_reportlab()
+    
+    target = io.BytesIO()
+    doc = SimpleDocTemplate(target, pagesize=A4,
+                           rightMargin=0.6*inch, leftMargin=0.6*inch,
+                           topMargin=0.6*inch, bottomMargin=0.6*inch,
+                           pageCompression=1, invariant=1)
     
-    story.append(Preformatted(code5, code_style))
+    # Title
+    title_page = (
+        Spacer(1, 0.5*inch),
+        static_paragraph("BB84 Advanced Technical Implementation", rl.TITLE_STYLE),
+        static_paragraph("Code Walkthroughs & Architecture Deep-Dive", rl.SUBTITLE_STYLE),
+        Spacer(1, 0.3*inch),
+        Paragraph(f"Generated: {generated_at}", rl.DATE_STYLE),
+        PageBreak(),
+    )
     
-    story.append(Paragraph("""
-    <b>Key Frontend Patterns:</b><br/>
-    • Early session state initialization prevents Streamlit errors<br/>
-    • Light theme enforced via CSS and HTML<br/>
-    • Tab-based interface for organized content<br/>
-    • Slider controls for parameter adjustment<br/>
-    • Lock mechanism prevents simultaneous simulations
-    """, normal))
-    story.append(PageBreak())
+    # ===== QUANTUM ENCODING =====
+    encoding = (
+        static_paragraph("1. Quantum Bit Encoding (Core Algorithm)", rl.HEADING_STYLE),
+        static_paragraph("""
+        The encode_qubit() function is the heart of BB84. It creates quantum circuits that encode classical 
+        bits using quantum gates. The function must support two bases: Z-basis (rectilinear) and X-basis (diagonal).
+        """, rl.NORMAL_STYLE),
+        static_paragraph("Code Implementation:", rl.SUBHEADING_STYLE),
+        rl.FastCodeBlock(_CODE_ENCODE_QUBIT.splitlines()),
+        static_paragraph("""
+        <b>Key Points:</b><br/>
+        • Z-basis uses computational basis directly (fast, no additional gates)<br/>
+        • X-basis uses Hadamard gate H = (1/√2)[[1,1],[1,-1]] for 45° rotation<br/>
+        • Measurement in wrong basis yields random result (50% for each outcome)<br/>
+        • This randomness is crucial for BB84's security
+        """, rl.NORMAL_STYLE),
+        PageBreak(),
+    )
+    
+    # ===== SIMULATION FLOW =====
+    transmission = (
+        static_paragraph("2. Quantum Transmission Simulation", rl.HEADING_STYLE),
+        static_paragraph("""
+        The simulate_transmission() function orchestrates the entire BB84 protocol. It handles Alice's 
+        encoding, quantum channel transmission, Bob's measurement, and optional Eve's eavesdropping.
+        """, rl.NORMAL_STYLE),
+        rl.FastCodeBlock(_CODE_TRANSMISSION.splitlines()),
+        static_paragraph("""
+        <b>Security Mechanism:</b><br/>
+        When Eve measures in the wrong basis, she gets a random result (50% correct, 50% wrong). 
+        Even if she re-prepares the state based on her result, Bob will see an increased error rate 
+        when his basis matches Alice's but differs from Eve's choice.
+        """, rl.NORMAL_STYLE),
+        static_paragraph("Analytic Fast Path:", rl.SUBHEADING_STYLE),
+        static_paragraph("""
+        The Qiskit version above is the reference implementation. Single-qubit BB84 outcomes are known 
+        analytically (matching basis returns the bit, mismatched basis a fair coin), so large runs can skip 
+        the simulator entirely and draw every outcome in a few vectorized numpy passes.
+        """, rl.NORMAL_STYLE),
+        rl.FastCodeBlock(_CODE_ANALYTIC_KERNEL.splitlines()),
+        PageBreak(),
+    )
+    
+    # ===== PRIVACY AMPLIFICATION =====
+    privacy = (
+        static_paragraph("3. Privacy Amplification (SHA-256/512)", rl.HEADING_STYLE),
+        static_paragraph("""
+        Privacy amplification extracts a secure key from the sifted key using cryptographic hashing. 
+        The algorithm ensures that even if Eve has partial information, the final key is secure.
+        """, rl.NORMAL_STYLE),
+        rl.FastCodeBlock(_CODE_PRIVACY_AMPLIFICATION.splitlines()),
+        static_paragraph("""
+        <b>Mathematical Security:</b><br/>
+        The key length formula ensures exponentially small probability (2^-128) that Eve can guess the final key, 
+        even with partial information quantified by QBER. This is information-theoretic security.
+        """, rl.NORMAL_STYLE),
+        PageBreak(),
+    )
+    
+    # ===== BLOCH SPHERE CODE =====
+    bloch = (
+        static_paragraph("4. Bloch Sphere Visualization Implementation", rl.HEADING_STYLE),
+        static_paragraph("""
+        The Bloch sphere visualization converts quantum statevectors to 3D coordinates for interactive visualization.
+        """, rl.NORMAL_STYLE),
+        rl.FastCodeBlock(_CODE_BLOCH_SPHERE.splitlines()),
+        static_paragraph("""
+        <b>Visualization Details:</b><br/>
+        • Bloch coordinates: θ ∈ [0,π] (polar), φ ∈ [0,2π] (azimuthal)<br/>
+        • Sphere radius = 1.0 (normalized unit sphere)<br/>
+        • State vectors shown as colored diamonds with connecting lines<br/>
+        • Interactive features: 3D rotation, zoom, hover information
+        """, rl.NORMAL_STYLE),
+        PageBreak(),
+    )
+    
+    # ===== STREAMLIT FRONTEND =====
+    frontend = (
+        static_paragraph("5. Streamlit Frontend Architecture", rl.HEADING_STYLE),
+        static_paragraph("""
+        The main application uses Streamlit for reactive UI with session state management.
+        """, rl.NORMAL_STYLE),
+        rl.FastCodeBlock(_CODE_STREAMLIT_APP.splitlines()),
+        static_paragraph("""
+        <b>Key Frontend Patterns:</b><br/>
+        • Early session state initialization prevents Streamlit errors<br/>
+        • Light theme enforced via CSS and HTML<br/>
+        • Tab-based interface for organized content<br/>
+        • Slider controls for parameter adjustment<br/>
+        • Lock mechanism prevents simultaneous simulations<br/>
+        • st.cache_data keeps timelines and Bloch figures across widget reruns
+        """, rl.NORMAL_STYLE),
+        PageBreak(),
+    )
     
     # ===== PERFORMANCE ANALYSIS =====
-    story.append(Paragraph("6. Performance Analysis & Optimization", heading_style))
-    
-    story.append(Paragraph("""
-    <b>Computational Bottlenecks:</b><br/>
-    1. <b>Quantum Simulation (O(2^n)):</b> Primary cost driver<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;• Qiskit-AER uses statevector simulation for small systems<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;• Exponential memory: 2^n complex amplitudes stored<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;• Practical limit: ~25-30 qubits on modern hardware<br/><br/>
-    
-    2. <b>Loop Execution:</b> Per-qubit processing<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;• Circuit creation: O(1) per qubit<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;• Compilation: O(1) with transpiler optimization<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;• Execution: O(1) per qubit (statevector simulator)<br/><br/>
-    
-    3. <b>Hashing (Privacy Amplification):</b> Negligible after simulation<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;• SHA-256: ~O(n/64) for n-bit input<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;• Typically < 1ms even for 10KB input<br/><br/>
-    
-    <b>Optimization Strategies Implemented:</b><br/>
-    • Qiskit transpiler optimization level 3 (aggressive)<br/>
-    • num_processes=1 for Streamlit compatibility<br/>
-    • Vectorized numpy operations where applicable<br/>
-    • Batch processing (future: GPU acceleration with Qiskit GPU backend)
-    """, normal))
-    story.append(PageBreak())
+    performance = (
+        static_paragraph("6. Performance Analysis & Optimization", rl.HEADING_STYLE),
+        static_paragraph("""
+        <b>Computational Bottlenecks:</b><br/>
+        1. <b>Quantum Simulation (O(2^n)):</b> Primary cost driver<br/>
+        &nbsp;&nbsp;&nbsp;&nbsp;• Qiskit-AER uses statevector simulation for small systems<br/>
+        &nbsp;&nbsp;&nbsp;&nbsp;• Exponential memory: 2^n complex amplitudes stored<br/>
+        &nbsp;&nbsp;&nbsp;&nbsp;• Practical limit: ~25-30 qubits on modern hardware<br/><br/>
+        
+        2. <b>Loop Execution:</b> Per-qubit processing<br/>
+        &nbsp;&nbsp;&nbsp;&nbsp;• Circuit creation: O(1) per qubit<br/>
+        &nbsp;&nbsp;&nbsp;&nbsp;• Compilation: O(1) with transpiler optimization<br/>
+        &nbsp;&nbsp;&nbsp;&nbsp;• Execution: O(1) per qubit (statevector simulator)<br/><br/>
+        
+        3. <b>Hashing (Privacy Amplification):</b> Negligible after simulation<br/>
+        &nbsp;&nbsp;&nbsp;&nbsp;• SHA-256: ~O(n/64) for n-bit input<br/>
+        &nbsp;&nbsp;&nbsp;&nbsp;• Typically < 1ms even for 10KB input<br/><br/>
+        
+        <b>Optimization Strategies Implemented:</b><br/>
+        • Qiskit transpiler optimization level 3 (aggressive)<br/>
+        • num_processes=1 for Streamlit compatibility<br/>
+        • Vectorized numpy operations where applicable<br/>
+        • Batch processing (future: GPU acceleration with Qiskit GPU backend)
+        """, rl.NORMAL_STYLE),
+        PageBreak(),
+    )
     
     # ===== SECURITY PROOFS =====
-    story.append(Paragraph("7. Security Proofs Summary", heading_style))
-    
-    story.append(Paragraph("""
-    <b>Theorem (BB84 Unconditional Security):</b><br/>
-    The BB84 protocol achieves unconditional security: an eavesdropper cannot gain full information 
-    about the generated key without being detected with high probability.<br/><br/>
-    
-    <b>Proof Sketch:</b><br/>
-    1. <b>No-Cloning Theorem:</b> Eve cannot perfectly copy unknown quantum states<br/>
-    2. <b>Measurement Postulate:</b> Eve's measurement collapses state to measured eigenstate<br/>
-    3. <b>QBER Analysis:</b> Wrong basis choice causes 25% QBER vs ~0% without Eve<br/>
-    4. <b>Statistical Test:</b> If observed QBER exceeds threshold, abort with >99.9% confidence Eve present<br/>
-    5. <b>Privacy Amplification:</b> If Eve has partial information quantified by QBER, hashing 
-    eliminates Eve's advantage to exponentially small (2^-128)<br/><br/>
-    
-    <b>Formal Bound:</b><br/>
-    Pr[Eve obtains final key] ≤ 2^(-n(1-H(E))) + 2^(-128)<br/>
-    where n = sifted key length, H(E) = Shannon entropy of Eve's information<br/><br/>
-    <b>Interpretation:</b> Probability of Eve guessing final key is exponentially small in key length.
-    """, normal))
-    story.append(PageBreak())
+    security = (
+        static_paragraph("7. Security Proofs Summary", rl.HEADING_STYLE),
+        static_paragraph("""
+        <b>Theorem (BB84 Unconditional Security):</b><br/>
+        The BB84 protocol achieves unconditional security: an eavesdropper cannot gain full information 
+        about the generated key without being detected with high probability.<br/><br/>
+        
+        <b>Proof Sketch:</b><br/>
+        1. <b>No-Cloning Theorem:</b> Eve cannot perfectly copy unknown quantum states<br/>
+        2. <b>Measurement Postulate:</b> Eve's measurement collapses state to measured eigenstate<br/>
+        3. <b>QBER Analysis:</b> Wrong basis choice causes 25% QBER vs ~0% without Eve<br/>
+        4. <b>Statistical Test:</b> If observed QBER exceeds threshold, abort with >99.9% confidence Eve present<br/>
+        5. <b>Privacy Amplification:</b> If Eve has partial information quantified by QBER, hashing 
+        eliminates Eve's advantage to exponentially small (2^-128)<br/><br/>
+        
+        <b>Formal Bound:</b><br/>
+        Pr[Eve obtains final key] ≤ 2^(-n(1-H(E))) + 2^(-128)<br/>
+        where n = sifted key length, H(E) = Shannon entropy of Eve's information<br/><br/>
+        <b>Interpretation:</b> Probability of Eve guessing final key is exponentially small in key length.
+        """, rl.NORMAL_STYLE),
+        PageBreak(),
+    )
     
     # ===== CONCLUSION =====
-    story.append(Paragraph("Conclusion", heading_style))
+    conclusion = (
+        static_paragraph("Conclusion", rl.HEADING_STYLE),
+        static_paragraph("""
+        This BB84 implementation demonstrates the power of quantum mechanics in cryptography. 
+        By combining quantum principles (no-cloning, wave function collapse) with classical cryptography 
+        (privacy amplification, QBER analysis), the system achieves unconditional security.<br/><br/>
+        
+        The modular Python architecture enables researchers to extend the system with new protocols, 
+        optimization techniques, or integration with actual quantum hardware. The comprehensive visualization 
+        framework helps students and judges understand each step of the protocol, from quantum encoding 
+        through privacy amplification to final key agreement.<br/><br/>
+        
+        <b>Hackathon Judges:</b> This implementation showcases deep understanding of both quantum computing 
+        and cryptography, with production-grade code quality, comprehensive documentation, and interactive 
+        educational value.
+        """, rl.NORMAL_STYLE),
+    )
     
-    story.append(Paragraph("""
-    This BB84 implementation demonstrates the power of quantum mechanics in cryptography. 
-    By combining quantum principles (no-cloning, wave function collapse) with classical cryptography 
-    (privacy amplification, QBER analysis), the system achieves unconditional security.<br/><br/>
+    # Build PDF. Cached paragraphs pick up layout state during a build, so
+    # hand ReportLab shallow copies that still share the parsed text.
+    story = itertools.chain(title_page, encoding, transmission, privacy, bloch, frontend, performance, security, conclusion)
+    doc.build([copy.copy(flowable) for flowable in story])
+    return target.getvalue()
+
+def create_advanced_guide(output=None, generated_at: str | None = None):
+    """Create advanced technical guide with code snippets
     
-    The modular Python architecture enables researchers to extend the system with new protocols, 
-    optimization techniques, or integration with actual quantum hardware. The comprehensive visualization 
-    framework helps students and judges understand each step of the protocol, from quantum encoding 
-    through privacy amplification to final key agreement.<br/><br/>
+    Args:
+        output: Optional file-like object to stream the PDF into. When omitted
+            the PDF is rendered in memory and its bytes are returned, e.g. for
+            st.download_button.
+        generated_at: Timestamp shown on the title page. Pass a stable value
+            (e.g. captured at session start) to get byte-identical PDFs;
+            defaults to the current time.
     
-    <b>Hackathon Judges:</b> This implementation showcases deep understanding of both quantum computing 
-    and cryptography, with production-grade code quality, comprehensive documentation, and interactive 
-    educational value.
-    """, normal))
+    Returns:
+        The output file-like object if given, otherwise the PDF bytes
+    """
+    
+    if generated_at is None:
+        generated_at = datetime.now().strftime('%B %d, %Y at %H:%M:%S UTC')
     
-    # Build PDF
-    doc.build(story)
+    pdf_bytes = _render_advanced_guide(generated_at)
+    
+    if output is None:
+        return pdf_bytes
+    output.write(pdf_bytes)
+    return output
+
+def save_advanced_guide(pdf_path=DEFAULT_PDF_PATH):
+    """Write the advanced guide to pdf_path and return the path"""
+    with open(pdf_path, 'wb') as pdf_file:
+        create_advanced_guide(pdf_file)
     print(f"✅ Advanced PDF generated: {pdf_path}")
     return pdf_path
 
+def create_all_guides():
+    """Build the advanced, hackathon and learning guides in parallel processes.
+
+    ReportLab layout is CPU-bound and holds the GIL, so each generator gets
+    its own process. Returns the generated PDF paths in submission order.
+    """
+    from BB84_LEARNING_GUIDE import create_learning_guide
+    from HACKATHON_IMPLEMENTATION_GUIDE import save_hackathon_pdf
+    
+    generators = (save_advanced_guide, save_hackathon_pdf, create_learning_guide)
+    with ProcessPoolExecutor(max_workers=min(len(generators), os.cpu_count() or 1)) as executor:
+        futures = [executor.submit(generator) for generator in generators]
+        wait(futures)
+    return [future.result() for future in futures]
+
 if __name__ == "__main__":
-    pdf = create_advanced_guide()
-    print(f"Location: {pdf}")
+    if "--all" in sys.argv[1:]:
+        for pdf in create_all_guides():
+            print(f"Location: {pdf}")
+    else:
+        pdf = save_advanced_guide()
+        print(f"Location: {pdf}")
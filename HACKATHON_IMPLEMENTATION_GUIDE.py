@@ -7,56 +7,94 @@ technical architecture for hackathon judges.
 This script creates a professional PDF without deploying to GitHub.
 """
 
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle
-from reportlab.lib import colors
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY, TA_RIGHT
-from datetime import datetime
-
-def create_hackathon_pdf():
-    """Create comprehensive implementation guide PDF"""
-    
-    # Create PDF document
-    pdf_path = "/home/keerthan/Desktop/bb84_2/BB84_QKD_Implementation_Guide.pdf"
-    doc = SimpleDocTemplate(pdf_path, pagesize=A4,
-                           rightMargin=0.75*inch, leftMargin=0.75*inch,
-                           topMargin=0.75*inch, bottomMargin=0.75*inch)
-    
-    # Define styles
+from datetime import date
+from functools import cache, lru_cache
+import io
+import itertools
+from types import SimpleNamespace
+from typing import Final
+import copy
+
+from bb84_guide_utils import lazy_getattr, static_paragraph, write_atomic
+
+# Written to the current working directory unless a path is given
+DEFAULT_PDF_PATH = "BB84_QKD_Implementation_Guide.pdf"
+
+# Public names built by _get_reportlab() and served through __getattr__
+_LAZY_NAMES = frozenset({
+    'BLUE_600', 'BLUE_800', 'INDIGO_50', 'INDIGO_100', 'GRAY_50', 'GRAY_400',
+    'GRAY_600', 'GREEN_50', 'EMERALD_100', 'EMERALD_600', 'PURPLE_50',
+    'VIOLET_100', 'VIOLET_600',
+    'TITLE_STYLE', 'HEADING_STYLE', 'SUBHEADING_STYLE', 'NORMAL_STYLE',
+    'CODE_STYLE', 'LIST_STYLE', 'THANKS_STYLE', 'FOOTER_STYLE', 'MARGIN',
+    'PAGE_TEMPLATE', 'TITLE_PAGE_TEMPLATE',
+    'ACHIEVEMENTS_TABLE_STYLE', 'STEPS_TABLE_STYLE', 'ARCH_TABLE_STYLE',
+    'UI_TABLE_STYLE', 'METHODS_TABLE_STYLE', 'STACK_TABLE_STYLE',
+    'COMPLEXITY_TABLE_STYLE', 'PERF_TABLE_STYLE', 'INNOVATIONS_TABLE_STYLE',
+})
+
+@cache
+def _get_reportlab():
+    """Import ReportLab and build the guide's styles and page template on first use.
+
+    Importing this module stays cheap; ReportLab is only loaded when the guide
+    is actually generated.
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.platypus import Frame, PageTemplate, TableStyle
+    
+    # Palette, parsed from hex once
+    blue_600 = colors.HexColor('#2563eb')
+    blue_800 = colors.HexColor('#1e40af')
+    indigo_50 = colors.HexColor('#f0f4ff')
+    indigo_100 = colors.HexColor('#e0e7ff')
+    gray_50 = colors.HexColor('#f8f9fa')
+    gray_400 = colors.HexColor('#999999')
+    gray_600 = colors.HexColor('#666666')
+    green_50 = colors.HexColor('#f0fdf4')
+    emerald_100 = colors.HexColor('#d1fae5')
+    emerald_600 = colors.HexColor('#059669')
+    purple_50 = colors.HexColor('#faf5ff')
+    violet_100 = colors.HexColor('#ede9fe')
+    violet_600 = colors.HexColor('#7c3aed')
+
     styles = getSampleStyleSheet()
-    
+
+    # Paragraph styles (built once per process and shared by every call)
     title_style = ParagraphStyle(
         'CustomTitle',
         parent=styles['Heading1'],
         fontSize=28,
-        textColor=colors.HexColor('#2563eb'),
+        textColor=blue_600,
         spaceAfter=30,
         alignment=TA_CENTER,
         fontName='Helvetica-Bold'
     )
-    
+
     heading_style = ParagraphStyle(
         'CustomHeading',
         parent=styles['Heading2'],
         fontSize=16,
-        textColor=colors.HexColor('#1e40af'),
+        textColor=blue_800,
         spaceAfter=12,
         spaceBefore=12,
         fontName='Helvetica-Bold'
     )
-    
+
     subheading_style = ParagraphStyle(
         'CustomSubHeading',
         parent=styles['Heading3'],
         fontSize=13,
-        textColor=colors.HexColor('#2563eb'),
+        textColor=blue_600,
         spaceAfter=10,
         spaceBefore=10,
         fontName='Helvetica-Bold'
     )
-    
+
     normal_style = ParagraphStyle(
         'CustomNormal',
         parent=styles['Normal'],
@@ -64,32 +102,382 @@ def create_hackathon_pdf():
         alignment=TA_JUSTIFY,
         spaceAfter=10
     )
-    
-    # Build content
-    story = []
-    
+
+    # Code listings are Preformatted, so they skip the paragraph markup parser
+    code_style = ParagraphStyle(
+        'CustomCode',
+        parent=normal_style,
+        fontName='Courier',
+        fontSize=8,
+        leading=10
+    )
+
+    # One line per entry at the spacing separate paragraphs used to have
+    list_style = ParagraphStyle(
+        'CustomList',
+        parent=normal_style,
+        alignment=TA_LEFT,
+        leading=22
+    )
+
+    # Closing lines of section 12
+    thanks_style = ParagraphStyle(
+        'thanks',
+        parent=styles['Normal'],
+        fontSize=11,
+        textColor=blue_600,
+        alignment=TA_CENTER,
+        fontName='Helvetica-Bold'
+    )
+
+    footer_style = ParagraphStyle(
+        'footer',
+        parent=styles['Normal'],
+        fontSize=9,
+        textColor=gray_600,
+        alignment=TA_CENTER
+    )
+
+    # One full-height frame inside the 0.75" margins, shared by every build.
+    # The title page keeps its frame empty and is drawn by _draw_title_page().
+    margin = 0.75*inch
+    page_template = PageTemplate(id='main', frames=[
+        Frame(margin, margin, A4[0] - 2*margin, A4[1] - 2*margin, id='normal')
+    ])
+    title_page_template = PageTemplate(id='title', frames=[
+        Frame(margin, margin, A4[0] - 2*margin, A4[1] - 2*margin, id='title')
+    ], onPage=_draw_title_page)
+
+    # Table styles (built once per process and shared by every call)
+    achievements_table_style = TableStyle([
+        ('LEFTPADDING', (0, 0), (-1, -1), 12),
+        ('TOPPADDING', (0, 0), (-1, -1), 8),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ('BACKGROUND', (0, 0), (-1, -1), indigo_50),
+        ('TEXTCOLOR', (0, 0), (-1, -1), blue_800),
+        ('GRID', (0, 0), (-1, -1), 0.5, indigo_100),
+    ])
+
+    steps_table_style = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), blue_600),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 9),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('GRID', (0, 0), (-1, -1), 1, blue_600),
+        ('FONTSIZE', (0, 1), (-1, -1), 8),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, indigo_50]),
+    ])
+
+    arch_table_style = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), blue_800),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 8),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
+        ('GRID', (0, 0), (-1, -1), 0.5, indigo_100),
+        ('FONTSIZE', (0, 1), (-1, -1), 8),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, gray_50]),
+    ])
+
+    ui_table_style = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), blue_600),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 8),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
+        ('GRID', (0, 0), (-1, -1), 0.5, indigo_100),
+        ('FONTSIZE', (0, 1), (-1, -1), 8),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, gray_50]),
+    ])
+
+    methods_table_style = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), blue_800),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 7),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+        ('GRID', (0, 0), (-1, -1), 0.5, indigo_100),
+        ('FONTSIZE', (0, 1), (-1, -1), 7),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, gray_50]),
+    ])
+
+    stack_table_style = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), blue_600),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 8),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
+        ('GRID', (0, 0), (-1, -1), 0.5, indigo_100),
+        ('FONTSIZE', (0, 1), (-1, -1), 8),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, gray_50]),
+    ])
+
+    complexity_table_style = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), blue_600),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 8),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
+        ('GRID', (0, 0), (-1, -1), 0.5, indigo_100),
+        ('FONTSIZE', (0, 1), (-1, -1), 8),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, gray_50]),
+    ])
+
+    perf_table_style = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), emerald_600),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 9),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
+        ('GRID', (0, 0), (-1, -1), 0.5, emerald_100),
+        ('FONTSIZE', (0, 1), (-1, -1), 9),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, green_50]),
+    ])
+
+    innovations_table_style = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), violet_600),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 8),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
+        ('GRID', (0, 0), (-1, -1), 0.5, violet_100),
+        ('FONTSIZE', (0, 1), (-1, -1), 8),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, purple_50]),
+    ])
+    
+    return SimpleNamespace(
+        STYLES=styles,
+        BLUE_600=blue_600,
+        BLUE_800=blue_800,
+        INDIGO_50=indigo_50,
+        INDIGO_100=indigo_100,
+        GRAY_50=gray_50,
+        GRAY_400=gray_400,
+        GRAY_600=gray_600,
+        GREEN_50=green_50,
+        EMERALD_100=emerald_100,
+        EMERALD_600=emerald_600,
+        PURPLE_50=purple_50,
+        VIOLET_100=violet_100,
+        VIOLET_600=violet_600,
+        TITLE_STYLE=title_style,
+        HEADING_STYLE=heading_style,
+        SUBHEADING_STYLE=subheading_style,
+        NORMAL_STYLE=normal_style,
+        CODE_STYLE=code_style,
+        LIST_STYLE=list_style,
+        THANKS_STYLE=thanks_style,
+        FOOTER_STYLE=footer_style,
+        MARGIN=margin,
+        PAGE_TEMPLATE=page_template,
+        TITLE_PAGE_TEMPLATE=title_page_template,
+        ACHIEVEMENTS_TABLE_STYLE=achievements_table_style,
+        STEPS_TABLE_STYLE=steps_table_style,
+        ARCH_TABLE_STYLE=arch_table_style,
+        UI_TABLE_STYLE=ui_table_style,
+        METHODS_TABLE_STYLE=methods_table_style,
+        STACK_TABLE_STYLE=stack_table_style,
+        COMPLEXITY_TABLE_STYLE=complexity_table_style,
+        PERF_TABLE_STYLE=perf_table_style,
+        INNOVATIONS_TABLE_STYLE=innovations_table_style,
+    )
+
+# The public styles and page template import ReportLab on first access
+__getattr__ = lazy_getattr(__name__, _LAZY_NAMES, _get_reportlab)
+
+@lru_cache(maxsize=1)
+def _generated_date(day):
+    """Return the title page's "Generated" date, formatted once per calendar day"""
+    return day.strftime('%B %d, %Y')
+
+def _chunked_table(rows, style, chunk=40, **kwargs):
+    """Split a header + body table into Tables of at most `chunk` body rows.
+
+    Every piece repeats the header row (also across page breaks, via
+    LongTable); ReportLab's width and split passes get slow on tall tables,
+    so this keeps each one small as the data grows.
+    """
+    from reportlab.platypus import LongTable
+    header, body = rows[:1], rows[1:]
+    return [LongTable(header + body[i:i + chunk], style=style, repeatRows=1, **kwargs)
+            for i in range(0, len(body), chunk)]
+
+def _code_listing(code):
+    """Return flowables for a Preformatted code listing that never overflows.
+
+    Preformatted does not wrap, so KeepInFrame scales down a listing wider than
+    the frame (or taller than 8"). The CondPageBreak moves a listing that would
+    not fit on the rest of the page to a new one, rather than letting
+    KeepInFrame shrink it into the leftover space.
+    """
+    from reportlab.lib.units import inch
+    from reportlab.platypus import CondPageBreak, KeepInFrame, Preformatted
+    style = _get_reportlab().CODE_STYLE
+    height = (code.count('\n') + 1) * style.leading
+    return (CondPageBreak(min(height, 8*inch)),
+            KeepInFrame(0, 8*inch, [Preformatted(code, style)], mode='shrink'))
+
+# Code listings (plain text with real newlines and indentation)
+_CODE_PRIVACY_AMPLIFICATION: Final[str] = """def privacy_amplification(sifted_key, error_rate):
+    # Convert error rate to Shannon entropy
+    e = float(np.clip(error_rate, 0.0, 1.0))
+    if e > 0 and e < 1:
+        h_eve = -e*log₂(e) - (1-e)*log₂(1-e)
+    else:
+        h_eve = 0.0
+
+    # Calculate secure key length
+    n = len(sifted_key)
+    secure_length = n*(1-h_eve) - 2*log₂(1/2^-128)
+    secure_length = max(0, int(secure_length))
+
+    # Apply SHA-256 hashing (key as '0'/'1' text, built in one numpy pass)
+    key_bytes = (sifted_key + ord('0')).astype(uint8).tobytes()
+    digest = hashlib.sha256(key_bytes).digest()
+
+    # Extract final key: unpackbits expands the raw digest MSB-first in C
+    final_key = unpackbits(frombuffer(digest, dtype=uint8))[:secure_length]
+    return final_key"""
+
+_CODE_BLOCH_SPHERE: Final[str] = """def plotly_bloch_sphere(states):
+    # Create sphere surface
+    u = linspace(0, 2π, 50)
+    v = linspace(0, π, 50)
+    x_sphere = outer(cos(u), sin(v))
+    y_sphere = outer(sin(u), sin(v))
+    z_sphere = outer(ones(len(u)), cos(v))
+
+    fig = Figure()
+    fig.add_trace(Surface(x=x_sphere, y=y_sphere, z=z_sphere,
+        opacity=0.15, colorscale='Blues'))
+
+    # Add axes
+    for axis_config in [X, Y, Z axes]:
+        fig.add_trace(Scatter3d(x, y, z, mode='lines', ...))
+
+    # Add quantum states
+    for sv in states:
+        a, b = sv.data  # Extract amplitudes
+        theta = 2*arccos(|a|)
+        phi = arg(b) - arg(a)
+        x_p = sin(theta)*cos(phi)
+        y_p = sin(theta)*sin(phi)
+        z_p = cos(theta)
+        fig.add_trace(Scatter3d([x_p], [y_p], [z_p],
+            marker=dict(size=10, symbol='diamond'),...))
+    return fig"""
+
+# Static table data (built once at import)
+_STACK_DATA: Final = (
+    ("Category", "Component", "Version", "Purpose"),
+    ("Web Framework", "Streamlit", "1.41.0", "Interactive web UI with real-time updates"),
+    ("Quantum", "Qiskit", "1.0.2", "Quantum circuit creation and execution"),
+    ("Quantum", "Qiskit-AER", "0.13.3", "High-performance quantum simulator"),
+    ("Visualization", "Plotly", "5.22.0", "3D charts, interactive visualizations"),
+    ("Visualization", "Matplotlib", "3.8.4", "Matplotlib for additional chart types"),
+    ("Data Science", "NumPy", "1.26.4", "Numerical computing, array operations"),
+    ("Data Science", "Pandas", "2.2.2", "Data frame manipulation, timeline creation"),
+    ("PDF Generation", "ReportLab", "≥3.6.0", "Programmatic PDF report creation"),
+    ("PDF Graphics", "PyLaTeX", "Included in ReportLab", "LaTeX integration for formulas"),
+    ("Utilities", "SciPy", "≥1.13.0", "Scientific computing utilities"),
+    ("Image Processing", "Pillow", "10.4.0", "Image handling, logo loading"),
+    ("Hashing", "hashlib", "Built-in", "SHA-256, SHA-512 for privacy amplification"),
+    ("Configuration", "Custom config.py", "Home-built", "Centralized settings management"),
+)
+_STACK_WIDTHS: Final = (1.5, 1.8, 1.3, 2.4)  # inches
+
+_COMPLEXITY_DATA: Final = (
+    ("Operation", "Time Complexity", "Space Complexity", "Notes"),
+    ("Qubit Encoding", "O(1)", "O(1)", "Single qubit circuit creation"),
+    ("Quantum Simulation", "O(2^n)", "O(2^n)", "Qiskit-AER uses exponential resources"),
+    ("Measurement", "O(1)", "O(1)", "Single shot measurement"),
+    ("Sifting", "O(n)", "O(n)", "Linear scan for basis matches"),
+    ("QBER Calculation", "O(n)", "O(1)", "Single pass with running total"),
+    ("Privacy Amplification", "O(n + 256)", "O(256)", "SHA-256 digest + extraction"),
+    ("Timeline Creation", "O(n)", "O(n)", "DataFrame with full qubit history"),
+    ("PDF Generation", "O(n)", "O(n)", "Proportional to timeline size"),
+)
+_COMPLEXITY_WIDTHS: Final = (1.8, 1.8, 1.8, 1.6)  # inches
+
+_PERF_DATA: Final = (
+    ("Scenario", "Qubits", "Time", "RAM Used", "Key Length"),
+    ("Fast Demo", "256", "~1.2s", "~50MB", "~30-50 bits"),
+    ("Standard", "512", "~2.4s", "~80MB", "~60-100 bits"),
+    ("Detailed", "1024", "~4.8s", "~120MB", "~120-200 bits"),
+    ("Maximum", "2048", "~10s", "~200MB", "~250-400 bits"),
+)
+_PERF_WIDTHS: Final = (2.0, 1.2, 1.2, 1.2, 1.4)  # inches
+
+_INNOVATIONS_DATA: Final = (
+    ("Innovation", "Impact", "Technical Achievement"),
+    ("3D Bloch Sphere Visualization", "Makes abstract quantum states concrete and understandable", "Plotly 3D rendering + Qiskit Statevector"),
+    ("Real-time Eavesdropping Detection", "Demonstrates quantum security principles live", "Comparative simulation + QBER analysis"),
+    ("Privacy Amplification with SHA-256/512", "Shows how to extract secure keys from noisy channels", "Entropy calculation + hash-based key distillation"),
+    ("Comparative Analysis Framework", "Enables side-by-side comparison of secure vs. compromised channels", "Dual simulation with metrics"),
+    ("Timeline-based Qubit Tracking", "Provides unprecedented visibility into BB84 processing steps", "DataFrame with full qubit history"),
+    ("Professional PDF Report Generation", "Creates publication-quality documentation of results", "ReportLab integration with graphs"),
+    ("Light Theme Enforcement", "Ensures readability across all user devices and preferences", "CSS + JavaScript theme override"),
+    ("Modular Python Architecture", "Enables easy extension and educational understanding", "Separation of concerns: simulator, utils, viz, config"),
+)
+_INNOVATIONS_WIDTHS: Final = (1.8, 2.2, 2.5)  # inches
+
+def _draw_title_page(canvas, doc):
+    """Draw the static title page straight onto the canvas (no flowables to lay out)"""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import inch
+    from reportlab.lib.utils import simpleSplit
+    rl = _get_reportlab()
+    width, height = A4
+    center = width / 2
+    
+    canvas.saveState()
     # ===== TITLE PAGE =====
-    story.append(Spacer(1, 1.5*inch))
-    story.append(Paragraph("BB84 Quantum Key Distribution Simulator", title_style))
-    story.append(Spacer(1, 0.3*inch))
-    story.append(Paragraph("Complete Implementation Guide", heading_style))
-    story.append(Spacer(1, 0.3*inch))
-    story.append(Paragraph("Technical Architecture, Hash Functions & Bloch Sphere Visualization", 
-                          ParagraphStyle('subtitle', parent=styles['Normal'], fontSize=12, 
-                                       textColor=colors.HexColor('#666666'), alignment=TA_CENTER)))
-    story.append(Spacer(1, 0.5*inch))
-    story.append(Paragraph("Developed by: Team Silicon", 
-                          ParagraphStyle('author', parent=styles['Normal'], fontSize=11, alignment=TA_CENTER)))
-    story.append(Paragraph("JNTUA - Department of Electronics and Communication Engineering", 
-                          ParagraphStyle('org', parent=styles['Normal'], fontSize=10, alignment=TA_CENTER)))
-    story.append(Spacer(1, 0.3*inch))
-    story.append(Paragraph(f"Generated: {datetime.now().strftime('%B %d, %Y')}", 
-                          ParagraphStyle('date', parent=styles['Normal'], fontSize=9, 
-                                       textColor=colors.HexColor('#999999'), alignment=TA_CENTER)))
-    story.append(PageBreak())
-    
+    canvas.setFillColor(rl.BLUE_600)
+    canvas.setFont('Helvetica-Bold', 28)
+    y = height - 2.7*inch
+    for line in simpleSplit("BB84 Quantum Key Distribution Simulator",
+                            'Helvetica-Bold', 28, width - 2*rl.MARGIN):
+        canvas.drawCentredString(center, y, line)
+        y -= 34
+    
+    canvas.setFillColor(rl.BLUE_800)
+    canvas.setFont('Helvetica-Bold', 16)
+    canvas.drawString(rl.MARGIN + 6, height - 4.1*inch, "Complete Implementation Guide")
+    
+    canvas.setFillColor(rl.GRAY_600)
+    canvas.setFont('Helvetica', 12)
+    canvas.drawCentredString(center, height - 4.75*inch,
+                             "Technical Architecture, Hash Functions & Bloch Sphere Visualization")
+    
+    canvas.setFillColorRGB(0, 0, 0)
+    canvas.setFont('Helvetica', 11)
+    canvas.drawCentredString(center, height - 5.4*inch, "Developed by: Team Silicon")
+    canvas.setFont('Helvetica', 10)
+    canvas.drawCentredString(center, height - 5.4*inch - 14,
+                             "JNTUA - Department of Electronics and Communication Engineering")
+    
+    canvas.setFillColor(rl.GRAY_400)
+    canvas.setFont('Helvetica', 9)
+    canvas.drawCentredString(center, height - 6.05*inch, f"Generated: {doc.generated_date}")
+    canvas.restoreState()
+
+def _toc_flowables():
+    """Yield the table of contents"""
+    rl = _get_reportlab()
     # ===== TABLE OF CONTENTS =====
-    story.append(Paragraph("Table of Contents", heading_style))
+    yield static_paragraph("Table of Contents", rl.HEADING_STYLE)
     toc_items = [
         "1. Executive Summary",
         "2. Project Overview & Uniqueness",
@@ -105,22 +493,25 @@ def create_hackathon_pdf():
         "12. Conclusion & Innovation"
     ]
     
-    for item in toc_items:
-        story.append(Paragraph(item, normal_style))
-    story.append(PageBreak())
-    
+    yield static_paragraph("<br/>".join(toc_items), rl.LIST_STYLE)
+
+def _executive_summary_flowables():
+    """Yield section 1: executive summary and key achievements"""
+    from reportlab.lib.units import inch
+    from reportlab.platypus import Spacer, Table
+    rl = _get_reportlab()
     # ===== 1. EXECUTIVE SUMMARY =====
-    story.append(Paragraph("1. Executive Summary", heading_style))
-    story.append(Paragraph("""
+    yield static_paragraph("1. Executive Summary", rl.HEADING_STYLE)
+    yield static_paragraph("""
     This document provides a comprehensive technical overview of the BB84 Quantum Key Distribution (QKD) 
     Simulator - an interactive educational and demonstration platform for quantum cryptography. The system 
     implements the Bennett-Brassard 1984 protocol with advanced visualization, real-time quantum state 
     monitoring, and sophisticated privacy amplification mechanisms using industry-standard cryptographic 
     hash functions.
-    """, normal_style))
-    story.append(Spacer(1, 0.2*inch))
+    """, rl.NORMAL_STYLE)
+    yield Spacer(1, 0.2*inch)
     
-    story.append(Paragraph("Key Achievements:", subheading_style))
+    yield static_paragraph("Key Achievements:", rl.SUBHEADING_STYLE)
     achievements = [
         "✓ Full BB84 protocol implementation with Eve eavesdropping detection",
         "✓ Real-time quantum state visualization on Bloch sphere (3D interactive)",
@@ -131,32 +522,27 @@ def create_hackathon_pdf():
         "✓ Multi-platform support (Web, Mobile, Desktop)"
     ]
     
-    tbl = Table([[Paragraph(item, normal_style)] for item in achievements], 
+    tbl = Table([[static_paragraph("<br/>".join(achievements), rl.LIST_STYLE)]],
                 colWidths=[7.5*inch])
-    tbl.setStyle(TableStyle([
-        ('LEFTPADDING', (0, 0), (-1, -1), 12),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#f0f4ff')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#1e40af')),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e0e7ff')),
-    ]))
-    story.append(tbl)
-    story.append(PageBreak())
-    
+    tbl.setStyle(rl.ACHIEVEMENTS_TABLE_STYLE)
+    yield tbl
+
+def _uniqueness_flowables():
+    """Yield section 2: project overview and uniqueness"""
+    rl = _get_reportlab()
     # ===== 2. PROJECT UNIQUENESS =====
-    story.append(Paragraph("2. Project Overview & Uniqueness", heading_style))
+    yield static_paragraph("2. Project Overview & Uniqueness", rl.HEADING_STYLE)
     
-    story.append(Paragraph("2.1 Problem Statement", subheading_style))
-    story.append(Paragraph("""
+    yield static_paragraph("2.1 Problem Statement", rl.SUBHEADING_STYLE)
+    yield static_paragraph("""
     Traditional cryptography relies on computational complexity that may become vulnerable to quantum 
     computers. Quantum Key Distribution offers information-theoretic security - a key cannot be intercepted 
     without detection due to quantum mechanics principles. This project makes QKD education and demonstration 
     accessible through an interactive, real-time simulator.
-    """, normal_style))
+    """, rl.NORMAL_STYLE)
     
-    story.append(Paragraph("2.2 Innovation & Uniqueness", subheading_style))
-    story.append(Paragraph("""
+    yield static_paragraph("2.2 Innovation & Uniqueness", rl.SUBHEADING_STYLE)
+    yield static_paragraph("""
     <b>1. Advanced Quantum Visualization:</b> Interactive 3D Bloch sphere visualization using Plotly with 
     real-time quantum state display for each qubit. Users can select individual qubits or ranges to visualize 
     their quantum states with mathematical precision.<br/><br/>
@@ -177,21 +563,24 @@ def create_hackathon_pdf():
     
     <b>6. Production-Grade Deployment:</b> Streamlit Cloud deployment with error suppression, light theme 
     enforcement, professional PDF report generation, and responsive design for mobile and desktop users.
-    """, normal_style))
-    story.append(PageBreak())
-    
+    """, rl.NORMAL_STYLE)
+
+def _protocol_flowables():
+    """Yield section 3: BB84 protocol fundamentals"""
+    from reportlab.lib.units import inch
+    rl = _get_reportlab()
     # ===== 3. BB84 PROTOCOL =====
-    story.append(Paragraph("3. BB84 Protocol Fundamentals", heading_style))
+    yield static_paragraph("3. BB84 Protocol Fundamentals", rl.HEADING_STYLE)
     
-    story.append(Paragraph("3.1 Protocol Overview", subheading_style))
-    story.append(Paragraph("""
+    yield static_paragraph("3.1 Protocol Overview", rl.SUBHEADING_STYLE)
+    yield static_paragraph("""
     The Bennett-Brassard 1984 (BB84) protocol is the first quantum key distribution scheme, enabling two 
     parties (Alice and Bob) to establish a shared secret key over a public quantum channel while detecting 
     any eavesdropping attempts. Security is guaranteed by the quantum no-cloning theorem and wave function collapse.
-    """, normal_style))
+    """, rl.NORMAL_STYLE)
     
     # BB84 Steps Table
-    story.append(Paragraph("3.2 Protocol Steps", subheading_style))
+    yield static_paragraph("3.2 Protocol Steps", rl.SUBHEADING_STYLE)
     bb84_steps = [
         ["Step", "Agent", "Action", "Quantum Property"],
         ["1", "Alice", "Generate random bits (0,1) and random bases (Z,X)", "Classical randomness"],
@@ -205,29 +594,20 @@ def create_hackathon_pdf():
         ["9", "Alice, Bob", "Final secure key ready for encryption/authentication", "Key ready"]
     ]
     
-    tbl = Table(bb84_steps, colWidths=[0.8*inch, 0.8*inch, 2.5*inch, 2.4*inch])
-    tbl.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2563eb')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f0f4ff')),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#2563eb')),
-        ('FONTSIZE', (0, 1), (-1, -1), 8),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f0f4ff')]),
-    ]))
-    story.append(tbl)
-    story.append(PageBreak())
-    
+    yield from _chunked_table(bb84_steps, rl.STEPS_TABLE_STYLE, colWidths=[0.8*inch, 0.8*inch, 2.5*inch, 2.4*inch])
+
+def _architecture_flowables():
+    """Yield section 4: system architecture"""
+    from reportlab.lib.units import inch
+    from reportlab.platypus import LongTable
+    rl = _get_reportlab()
     # ===== 4. SYSTEM ARCHITECTURE =====
-    story.append(Paragraph("4. System Architecture", heading_style))
+    yield static_paragraph("4. System Architecture", rl.HEADING_STYLE)
     
-    story.append(Paragraph("4.1 High-Level Architecture", subheading_style))
-    story.append(Paragraph("""
+    yield static_paragraph("4.1 High-Level Architecture", rl.SUBHEADING_STYLE)
+    yield static_paragraph("""
     The system follows a modular, layered architecture with clear separation of concerns:
-    """, normal_style))
+    """, rl.NORMAL_STYLE)
     
     arch_data = [
         ["Layer", "Component", "Purpose", "Key Files"],
@@ -246,34 +626,25 @@ def create_hackathon_pdf():
         ["", "Environment Variables", "Logger levels, Streamlit configuration, theme settings", ".streamlit/config.toml"],
     ]
     
-    tbl = Table(arch_data, colWidths=[1.2*inch, 1.5*inch, 2.2*inch, 1.6*inch])
-    tbl.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1e40af')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f8f9fa')),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e0e7ff')),
-        ('FONTSIZE', (0, 1), (-1, -1), 8),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')]),
-    ]))
-    story.append(tbl)
-    story.append(PageBreak())
-    
+    tbl = LongTable(arch_data, colWidths=[1.2*inch, 1.5*inch, 2.2*inch, 1.6*inch], repeatRows=1)
+    tbl.setStyle(rl.ARCH_TABLE_STYLE)
+    yield tbl
+
+def _hash_function_flowables():
+    """Yield section 5: privacy amplification hash functions"""
+    rl = _get_reportlab()
     # ===== 5. HASH FUNCTION IMPLEMENTATION =====
-    story.append(Paragraph("5. Hash Function Implementation - Privacy Amplification", heading_style))
+    yield static_paragraph("5. Hash Function Implementation - Privacy Amplification", rl.HEADING_STYLE)
     
-    story.append(Paragraph("5.1 Overview", subheading_style))
-    story.append(Paragraph("""
+    yield static_paragraph("5.1 Overview", rl.SUBHEADING_STYLE)
+    yield static_paragraph("""
     Privacy amplification is a crucial step in BB84 that uses cryptographic hashing to distill a secure key 
     from the sifted key. Even if Eve intercepts some qubits and Bob detects partial information leakage, 
     privacy amplification guarantees that the final key remains secure through information-theoretic bounds.
-    """, normal_style))
+    """, rl.NORMAL_STYLE)
     
-    story.append(Paragraph("5.2 Mathematical Foundation", subheading_style))
-    story.append(Paragraph("""
+    yield static_paragraph("5.2 Mathematical Foundation", rl.SUBHEADING_STYLE)
+    yield static_paragraph("""
     <b>Shannon Entropy of Eve's Information:</b><br/>
     H(E) = -e·log₂(e) - (1-e)·log₂(1-e)<br/>
     where e is the Quantum Bit Error Rate (QBER)<br/><br/>
@@ -289,10 +660,10 @@ def create_hackathon_pdf():
     <b>Interpretation:</b><br/>
     The formula ensures that even if Eve has partial information about the key (quantified by QBER), 
     the remaining bits after hashing have exponentially small probability of being guessed.
-    """, normal_style))
+    """, rl.NORMAL_STYLE)
     
-    story.append(Paragraph("5.3 Implementation Details", subheading_style))
-    story.append(Paragraph("""
+    yield static_paragraph("5.3 Implementation Details", rl.SUBHEADING_STYLE)
+    yield static_paragraph("""
     <b>Algorithm Steps:</b><br/>
     1. <b>Input Processing:</b> Sifted key bits are concatenated into a binary string<br/>
     2. <b>Entropy Calculation:</b> Shannon entropy is computed from QBER using the formula above<br/>
@@ -314,45 +685,26 @@ def create_hackathon_pdf():
     • <b>Collision Resistance:</b> Negligible probability of two different inputs producing same hash<br/>
     • <b>Avalanche Effect:</b> Single bit change in input completely changes output<br/>
     • <b>Deterministic:</b> Same sifted key always produces same final key
-    """, normal_style))
-    
-    story.append(Paragraph("5.4 Python Implementation", subheading_style))
-    story.append(Paragraph("""
-    <font face="Courier" size="8">
-    def privacy_amplification(sifted_key, error_rate):<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;# Convert error rate to Shannon entropy<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;e = float(np.clip(error_rate, 0.0, 1.0))<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;if e > 0 and e < 1:<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;h_eve = -e*log₂(e) - (1-e)*log₂(1-e)<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;else:<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;h_eve = 0.0<br/><br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;# Calculate secure key length<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;n = len(sifted_key)<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;secure_length = n*(1-h_eve) - 2*log₂(1/2^-128)<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;secure_length = max(0, int(secure_length))<br/><br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;# Apply SHA-256 hashing<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;key_str = ''.join(str(int(b)) for b in sifted_key)<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;digest = hashlib.sha256(key_str.encode()).hexdigest()<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;binary_hash = bin(int(digest, 16))[2:].zfill(256)<br/><br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;# Extract final key<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;final_key = [int(b) for b in binary_hash[:secure_length]]<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;return final_key
-    </font>
-    """, normal_style))
-    story.append(PageBreak())
+    """, rl.NORMAL_STYLE)
     
+    yield static_paragraph("5.4 Python Implementation", rl.SUBHEADING_STYLE)
+    yield from _code_listing(_CODE_PRIVACY_AMPLIFICATION)
+
+def _bloch_sphere_flowables():
+    """Yield section 6: Bloch sphere visualization"""
+    rl = _get_reportlab()
     # ===== 6. BLOCH SPHERE VISUALIZATION =====
-    story.append(Paragraph("6. Bloch Sphere Visualization", heading_style))
+    yield static_paragraph("6. Bloch Sphere Visualization", rl.HEADING_STYLE)
     
-    story.append(Paragraph("6.1 Theoretical Background", subheading_style))
-    story.append(Paragraph("""
+    yield static_paragraph("6.1 Theoretical Background", rl.SUBHEADING_STYLE)
+    yield static_paragraph("""
     The Bloch sphere is a geometrical representation of quantum states of a two-level system (qubit). Every 
     pure quantum state can be uniquely represented as a point on the surface of a unit sphere. This visualization 
     helps users understand quantum state evolution and measurement outcomes intuitively.
-    """, normal_style))
+    """, rl.NORMAL_STYLE)
     
-    story.append(Paragraph("6.2 Bloch Sphere Mathematics", subheading_style))
-    story.append(Paragraph("""
+    yield static_paragraph("6.2 Bloch Sphere Mathematics", rl.SUBHEADING_STYLE)
+    yield static_paragraph("""
     <b>Qubit State Representation:</b><br/>
     |ψ⟩ = cos(θ/2)|0⟩ + e^(iφ)sin(θ/2)|1⟩<br/><br/>
     
@@ -372,10 +724,10 @@ def create_hackathon_pdf():
     • <b>X-Basis (Diagonal):</b> |+⟩ at east pole (90° in xy-plane), |-⟩ at west pole (270°)<br/>
     • Measurement in wrong basis: 50% probability of each outcome<br/>
     • Measurement in correct basis: Deterministic result (0° or 180°/90° or 270°)
-    """, normal_style))
+    """, rl.NORMAL_STYLE)
     
-    story.append(Paragraph("6.3 Implementation Architecture", subheading_style))
-    story.append(Paragraph("""
+    yield static_paragraph("6.3 Implementation Architecture", rl.SUBHEADING_STYLE)
+    yield static_paragraph("""
     <b>Key Components:</b><br/><br/>
     
     <b>1. Sphere Mesh Generation:</b><br/>
@@ -406,52 +758,29 @@ def create_hackathon_pdf():
     &nbsp;&nbsp;&nbsp;&nbsp;• Zoom: Scroll wheel to zoom in/out<br/>
     &nbsp;&nbsp;&nbsp;&nbsp;• Pan: Double-click to recenter<br/>
     &nbsp;&nbsp;&nbsp;&nbsp;• Legend: Toggle state visibility on/off
-    """, normal_style))
-    
-    story.append(Paragraph("6.4 Python Implementation Code", subheading_style))
-    story.append(Paragraph("""
-    <font face="Courier" size="7">
-    def plotly_bloch_sphere(states):<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;# Create sphere surface<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;u = linspace(0, 2π, 50)<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;v = linspace(0, π, 50)<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;x_sphere = outer(cos(u), sin(v))<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;y_sphere = outer(sin(u), sin(v))<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;z_sphere = outer(ones(len(u)), cos(v))<br/><br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;fig = Figure()<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;fig.add_trace(Surface(x=x_sphere, y=y_sphere, z=z_sphere,<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;opacity=0.15, colorscale='Blues'))<br/><br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;# Add axes<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;for axis_config in [X, Y, Z axes]:<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;fig.add_trace(Scatter3d(x, y, z, mode='lines', ...))<br/><br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;# Add quantum states<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;for sv in states:<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;a, b = sv.data  # Extract amplitudes<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;theta = 2*arccos(|a|)<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;phi = arg(b) - arg(a)<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;x_p = sin(theta)*cos(phi)<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;y_p = sin(theta)*sin(phi)<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;z_p = cos(theta)<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;fig.add_trace(Scatter3d([x_p], [y_p], [z_p],<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;marker=dict(size=10, symbol='diamond'),...))<br/>
-    &nbsp;&nbsp;&nbsp;&nbsp;return fig
-    </font>
-    """, normal_style))
-    story.append(PageBreak())
+    """, rl.NORMAL_STYLE)
     
+    yield static_paragraph("6.4 Python Implementation Code", rl.SUBHEADING_STYLE)
+    yield from _code_listing(_CODE_BLOCH_SPHERE)
+
+def _frontend_flowables():
+    """Yield section 7: frontend implementation"""
+    from reportlab.lib.units import inch
+    from reportlab.platypus import Spacer
+    rl = _get_reportlab()
     # ===== 7. FRONTEND IMPLEMENTATION =====
-    story.append(Paragraph("7. Frontend Implementation", heading_style))
+    yield static_paragraph("7. Frontend Implementation", rl.HEADING_STYLE)
     
-    story.append(Paragraph("7.1 Technology Stack", subheading_style))
-    story.append(Paragraph("""
+    yield static_paragraph("7.1 Technology Stack", rl.SUBHEADING_STYLE)
+    yield static_paragraph("""
     <b>Framework:</b> Streamlit 1.41.0<br/>
     <b>Purpose:</b> Real-time interactive web application with reactive updates<br/>
     <b>Visualization:</b> Plotly 5.22.0 (3D charts, interactive graphs)<br/>
     <b>Styling:</b> Custom CSS with light theme enforcement<br/>
     <b>Graphics:</b> SVG cliparts for professional UI elements
-    """, normal_style))
+    """, rl.NORMAL_STYLE)
     
-    story.append(Paragraph("7.2 User Interface Components", subheading_style))
+    yield static_paragraph("7.2 User Interface Components", rl.SUBHEADING_STYLE)
     
     ui_components = [
         ["Component", "Function", "Implementation"],
@@ -467,25 +796,11 @@ def create_hackathon_pdf():
         ["PDF Report", "Comprehensive analysis document", "create_pdf_report_with_graphs"],
     ]
     
-    tbl = Table(ui_components, colWidths=[1.8*inch, 2.3*inch, 2.9*inch])
-    tbl.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2563eb')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e0e7ff')),
-        ('FONTSIZE', (0, 1), (-1, -1), 8),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')]),
-    ]))
-    story.append(tbl)
+    yield from _chunked_table(ui_components, rl.UI_TABLE_STYLE, colWidths=[1.8*inch, 2.3*inch, 2.9*inch])
     
-    story.append(Spacer(1, 0.2*inch))
-    story.append(Paragraph("7.3 Session State Management", subheading_style))
-    story.append(Paragraph("""
+    yield Spacer(1, 0.2*inch)
+    yield static_paragraph("7.3 Session State Management", rl.SUBHEADING_STYLE)
+    yield static_paragraph("""
     <b>Critical Implementation Detail:</b> Streamlit reruns the entire script on each interaction. Session 
     state is used to preserve data across reruns:<br/><br/>
     
@@ -497,10 +812,10 @@ def create_hackathon_pdf():
     
     <b>Initialization:</b> All session state variables are initialized at module load time to prevent 
     "SessionInfo not initialized" errors common in Streamlit applications.
-    """, normal_style))
+    """, rl.NORMAL_STYLE)
     
-    story.append(Paragraph("7.4 Light Theme Enforcement", subheading_style))
-    story.append(Paragraph("""
+    yield static_paragraph("7.4 Light Theme Enforcement", rl.SUBHEADING_STYLE)
+    yield static_paragraph("""
     <b>Problem Solved:</b> Some users reported white text on black background in dark mode, making 
     the Polarization Analysis section unreadable.<br/><br/>
     
@@ -510,20 +825,24 @@ def create_hackathon_pdf():
     3. <b>Streamlit config.toml:</b> Theme settings hardcoded for light mode<br/>
     4. <b>JavaScript enforcement:</b> force_light_theme() function ensures light mode at runtime<br/>
     5. <b>Browser compatibility:</b> Works across all modern browsers and mobile devices
-    """, normal_style))
-    story.append(PageBreak())
-    
+    """, rl.NORMAL_STYLE)
+
+def _backend_flowables():
+    """Yield section 8: backend implementation"""
+    from reportlab.lib.units import inch
+    from reportlab.platypus import LongTable, Spacer
+    rl = _get_reportlab()
     # ===== 8. BACKEND IMPLEMENTATION =====
-    story.append(Paragraph("8. Backend Implementation", heading_style))
+    yield static_paragraph("8. Backend Implementation", rl.HEADING_STYLE)
     
-    story.append(Paragraph("8.1 Quantum Simulation Engine", subheading_style))
-    story.append(Paragraph("""
+    yield static_paragraph("8.1 Quantum Simulation Engine", rl.SUBHEADING_STYLE)
+    yield static_paragraph("""
     <b>Framework:</b> Qiskit 1.0.2 + Qiskit-AER 0.13.3<br/>
     <b>Simulator:</b> AerSimulator with CPU backend (GPU optional)<br/>
     <b>Optimization:</b> Qiskit's transpiler with optimization_level=3, num_processes=1 (Streamlit compatibility)
-    """, normal_style))
+    """, rl.NORMAL_STYLE)
     
-    story.append(Paragraph("8.2 BB84Simulator Class Structure", subheading_style))
+    yield static_paragraph("8.2 BB84Simulator Class Structure", rl.SUBHEADING_STYLE)
     
     methods = [
         ["Method", "Parameters", "Return Value", "Purpose"],
@@ -535,25 +854,13 @@ def create_hackathon_pdf():
         ["get_statevector_from_bit_basis()", "bit, basis", "Statevector", "Get quantum state for visualization"],
     ]
     
-    tbl = Table(methods, colWidths=[1.3*inch, 2.2*inch, 1.8*inch, 1.7*inch])
-    tbl.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1e40af')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 7),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e0e7ff')),
-        ('FONTSIZE', (0, 1), (-1, -1), 7),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')]),
-    ]))
-    story.append(tbl)
+    tbl = LongTable(methods, colWidths=[1.3*inch, 2.2*inch, 1.8*inch, 1.7*inch], repeatRows=1)
+    tbl.setStyle(rl.METHODS_TABLE_STYLE)
+    yield tbl
     
-    story.append(Spacer(1, 0.2*inch))
-    story.append(Paragraph("8.3 Detailed Simulation Flow", subheading_style))
-    story.append(Paragraph("""
+    yield Spacer(1, 0.2*inch)
+    yield static_paragraph("8.3 Detailed Simulation Flow", rl.SUBHEADING_STYLE)
+    yield static_paragraph("""
     <b>Qubit Encoding (Z-Basis):</b><br/>
     • For bit=0, basis=0 (Z): |0⟩ state (north pole)<br/>
     • For bit=1, basis=0 (Z): X gate applied → |1⟩ state (south pole)<br/>
@@ -575,10 +882,10 @@ def create_hackathon_pdf():
     • Eve measures qubit, which collapses state to her measurement result<br/>
     • Eve re-transmits measurement result to Bob (Eve's attempt to remain undetected)<br/>
     • Error injection: 25% QBER effect observed when Eve's basis differs from Alice's
-    """, normal_style))
+    """, rl.NORMAL_STYLE)
     
-    story.append(Paragraph("8.4 Utility Functions", subheading_style))
-    story.append(Paragraph("""
+    yield static_paragraph("8.4 Utility Functions", rl.SUBHEADING_STYLE)
+    yield static_paragraph("""
     <b>create_transmission_timeline()</b><br/>
     Creates pandas DataFrame with columns:<br/>
     BitIndex, AliceBit, AliceBasis, BobBasis, BobResult, BasisMatch, Error, Used<br/>
@@ -596,109 +903,49 @@ def create_hackathon_pdf():
     
     <b>calculate_eve_impact()</b><br/>
     Quantifies eavesdropping effects by comparing QBER with and without Eve, showing detection probability.
-    """, normal_style))
-    story.append(PageBreak())
-    
+    """, rl.NORMAL_STYLE)
+
+def _tech_stack_flowables():
+    """Yield section 9: technical stack and dependencies"""
+    from reportlab.lib.units import inch
+    from reportlab.platypus import LongTable
+    rl = _get_reportlab()
     # ===== 9. TECHNICAL STACK =====
-    story.append(Paragraph("9. Technical Stack & Dependencies", heading_style))
-    
-    stack_data = [
-        ["Category", "Component", "Version", "Purpose"],
-        ["Web Framework", "Streamlit", "1.41.0", "Interactive web UI with real-time updates"],
-        ["Quantum", "Qiskit", "1.0.2", "Quantum circuit creation and execution"],
-        ["Quantum", "Qiskit-AER", "0.13.3", "High-performance quantum simulator"],
-        ["Visualization", "Plotly", "5.22.0", "3D charts, interactive visualizations"],
-        ["Visualization", "Matplotlib", "3.8.4", "Matplotlib for additional chart types"],
-        ["Data Science", "NumPy", "1.26.4", "Numerical computing, array operations"],
-        ["Data Science", "Pandas", "2.2.2", "Data frame manipulation, timeline creation"],
-        ["PDF Generation", "ReportLab", "≥3.6.0", "Programmatic PDF report creation"],
-        ["PDF Graphics", "PyLaTeX", "Included in ReportLab", "LaTeX integration for formulas"],
-        ["Utilities", "SciPy", "≥1.13.0", "Scientific computing utilities"],
-        ["Image Processing", "Pillow", "10.4.0", "Image handling, logo loading"],
-        ["Hashing", "hashlib", "Built-in", "SHA-256, SHA-512 for privacy amplification"],
-        ["Configuration", "Custom config.py", "Home-built", "Centralized settings management"],
-    ]
-    
-    tbl = Table(stack_data, colWidths=[1.5*inch, 1.8*inch, 1.3*inch, 2.4*inch])
-    tbl.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2563eb')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e0e7ff')),
-        ('FONTSIZE', (0, 1), (-1, -1), 8),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')]),
-    ]))
-    story.append(tbl)
-    story.append(PageBreak())
+    yield static_paragraph("9. Technical Stack & Dependencies", rl.HEADING_STYLE)
     
+    tbl = LongTable(_STACK_DATA, colWidths=[w*inch for w in _STACK_WIDTHS], repeatRows=1)
+    tbl.setStyle(rl.STACK_TABLE_STYLE)
+    yield tbl
+
+def _performance_flowables():
+    """Yield section 10: performance metrics"""
+    from reportlab.lib.units import inch
+    from reportlab.platypus import LongTable, Spacer
+    rl = _get_reportlab()
     # ===== 10. PERFORMANCE METRICS =====
-    story.append(Paragraph("10. Performance Metrics", heading_style))
-    
-    story.append(Paragraph("10.1 Computational Complexity", subheading_style))
-    
-    complexity_data = [
-        ["Operation", "Time Complexity", "Space Complexity", "Notes"],
-        ["Qubit Encoding", "O(1)", "O(1)", "Single qubit circuit creation"],
-        ["Quantum Simulation", "O(2^n)", "O(2^n)", "Qiskit-AER uses exponential resources"],
-        ["Measurement", "O(1)", "O(1)", "Single shot measurement"],
-        ["Sifting", "O(n)", "O(n)", "Linear scan for basis matches"],
-        ["QBER Calculation", "O(n)", "O(1)", "Single pass with running total"],
-        ["Privacy Amplification", "O(n + 256)", "O(256)", "SHA-256 digest + extraction"],
-        ["Timeline Creation", "O(n)", "O(n)", "DataFrame with full qubit history"],
-        ["PDF Generation", "O(n)", "O(n)", "Proportional to timeline size"],
-    ]
+    yield static_paragraph("10. Performance Metrics", rl.HEADING_STYLE)
     
-    tbl = Table(complexity_data, colWidths=[1.8*inch, 1.8*inch, 1.8*inch, 1.6*inch])
-    tbl.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2563eb')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e0e7ff')),
-        ('FONTSIZE', (0, 1), (-1, -1), 8),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')]),
-    ]))
-    story.append(tbl)
-    
-    story.append(Spacer(1, 0.2*inch))
-    story.append(Paragraph("10.2 Empirical Performance (measured on Intel i7, 8GB RAM)", subheading_style))
-    
-    perf_data = [
-        ["Scenario", "Qubits", "Time", "RAM Used", "Key Length"],
-        ["Fast Demo", "256", "~1.2s", "~50MB", "~30-50 bits"],
-        ["Standard", "512", "~2.4s", "~80MB", "~60-100 bits"],
-        ["Detailed", "1024", "~4.8s", "~120MB", "~120-200 bits"],
-        ["Maximum", "2048", "~10s", "~200MB", "~250-400 bits"],
-    ]
+    yield static_paragraph("10.1 Computational Complexity", rl.SUBHEADING_STYLE)
     
-    tbl = Table(perf_data, colWidths=[2*inch, 1.2*inch, 1.2*inch, 1.2*inch, 1.4*inch])
-    tbl.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#059669')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#d1fae5')),
-        ('FONTSIZE', (0, 1), (-1, -1), 9),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f0fdf4')]),
-    ]))
-    story.append(tbl)
-    story.append(PageBreak())
+    tbl = LongTable(_COMPLEXITY_DATA, colWidths=[w*inch for w in _COMPLEXITY_WIDTHS], repeatRows=1)
+    tbl.setStyle(rl.COMPLEXITY_TABLE_STYLE)
+    yield tbl
     
+    yield Spacer(1, 0.2*inch)
+    yield static_paragraph("10.2 Empirical Performance (measured on Intel i7, 8GB RAM)", rl.SUBHEADING_STYLE)
+    
+    tbl = LongTable(_PERF_DATA, colWidths=[w*inch for w in _PERF_WIDTHS], repeatRows=1)
+    tbl.setStyle(rl.PERF_TABLE_STYLE)
+    yield tbl
+
+def _security_flowables():
+    """Yield section 11: security analysis"""
+    rl = _get_reportlab()
     # ===== 11. SECURITY ANALYSIS =====
-    story.append(Paragraph("11. Security Analysis", heading_style))
+    yield static_paragraph("11. Security Analysis", rl.HEADING_STYLE)
     
-    story.append(Paragraph("11.1 Information-Theoretic Security", subheading_style))
-    story.append(Paragraph("""
+    yield static_paragraph("11.1 Information-Theoretic Security", rl.SUBHEADING_STYLE)
+    yield static_paragraph("""
     <b>Unconditional Security:</b> BB84 provides security that doesn't depend on computational assumptions. 
     Even with infinite computational power, Eve cannot break BB84 without detection.<br/><br/>
     
@@ -712,10 +959,10 @@ def create_hackathon_pdf():
     • Without Eve: QBER ≈ 0% to 1% (only environmental noise)<br/>
     • With Eve: QBER ≈ 25% (Eve's wrong basis guesses cause 50% measurement errors, halved by basis matching)<br/>
     • Threshold typically set to 11% to detect eavesdropping with high confidence
-    """, normal_style))
+    """, rl.NORMAL_STYLE)
     
-    story.append(Paragraph("11.2 Privacy Amplification Security", subheading_style))
-    story.append(Paragraph("""
+    yield static_paragraph("11.2 Privacy Amplification Security", rl.SUBHEADING_STYLE)
+    yield static_paragraph("""
     <b>Problem:</b> Even with error detection, Eve may have partial information about the sifted key 
     (e.g., 25% of bits) if she guesses some bases correctly.<br/><br/>
     
@@ -732,10 +979,10 @@ def create_hackathon_pdf():
     H(E) = min(-e·log₂(e) - (1-e)·log₂(1-e))<br/>
     This gives the maximum information Eve could have learned. The final key length is adjusted to 
     guarantee that Eve's remaining information is exponentially small in 2^-128.
-    """, normal_style))
+    """, rl.NORMAL_STYLE)
     
-    story.append(Paragraph("11.3 Implementation Security Considerations", subheading_style))
-    story.append(Paragraph("""
+    yield static_paragraph("11.3 Implementation Security Considerations", rl.SUBHEADING_STYLE)
+    yield static_paragraph("""
     <b>1. Random Number Generation:</b><br/>
     &nbsp;&nbsp;&nbsp;&nbsp;• np.random.randint() used for Alice's bits, bases, Eve's measurements<br/>
     &nbsp;&nbsp;&nbsp;&nbsp;• Sufficient for educational simulation (not cryptographic RNG for production)<br/>
@@ -756,53 +1003,33 @@ def create_hackathon_pdf():
     &nbsp;&nbsp;&nbsp;&nbsp;• Each Streamlit session has independent session state<br/>
     &nbsp;&nbsp;&nbsp;&nbsp;• Different users' simulations don't interfere with each other<br/>
     &nbsp;&nbsp;&nbsp;&nbsp;• Keys are not persisted between sessions (no storage vulnerability)
-    """, normal_style))
-    story.append(PageBreak())
-    
+    """, rl.NORMAL_STYLE)
+
+def _conclusion_flowables():
+    """Yield section 12: conclusion and closing notes"""
+    from reportlab.lib.units import inch
+    from reportlab.platypus import LongTable, Spacer
+    rl = _get_reportlab()
     # ===== 12. CONCLUSION =====
-    story.append(Paragraph("12. Conclusion & Innovation Summary", heading_style))
+    yield static_paragraph("12. Conclusion & Innovation Summary", rl.HEADING_STYLE)
     
-    story.append(Paragraph("12.1 Project Highlights", subheading_style))
-    story.append(Paragraph("""
+    yield static_paragraph("12.1 Project Highlights", rl.SUBHEADING_STYLE)
+    yield static_paragraph("""
     This BB84 Quantum Key Distribution Simulator represents a comprehensive implementation of quantum 
     cryptography principles combined with modern web technologies. The system successfully bridges the 
     gap between theoretical quantum mechanics and practical cryptographic applications through an 
     interactive, educational platform.
-    """, normal_style))
-    
-    story.append(Paragraph("12.2 Key Innovation Points", subheading_style))
-    
-    innovations = [
-        ["Innovation", "Impact", "Technical Achievement"],
-        ["3D Bloch Sphere Visualization", "Makes abstract quantum states concrete and understandable", "Plotly 3D rendering + Qiskit Statevector"],
-        ["Real-time Eavesdropping Detection", "Demonstrates quantum security principles live", "Comparative simulation + QBER analysis"],
-        ["Privacy Amplification with SHA-256/512", "Shows how to extract secure keys from noisy channels", "Entropy calculation + hash-based key distillation"],
-        ["Comparative Analysis Framework", "Enables side-by-side comparison of secure vs. compromised channels", "Dual simulation with metrics"],
-        ["Timeline-based Qubit Tracking", "Provides unprecedented visibility into BB84 processing steps", "DataFrame with full qubit history"],
-        ["Professional PDF Report Generation", "Creates publication-quality documentation of results", "ReportLab integration with graphs"],
-        ["Light Theme Enforcement", "Ensures readability across all user devices and preferences", "CSS + JavaScript theme override"],
-        ["Modular Python Architecture", "Enables easy extension and educational understanding", "Separation of concerns: simulator, utils, viz, config"],
-    ]
+    """, rl.NORMAL_STYLE)
     
-    tbl = Table(innovations, colWidths=[1.8*inch, 2.2*inch, 2.5*inch])
-    tbl.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#7c3aed')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#ede9fe')),
-        ('FONTSIZE', (0, 1), (-1, -1), 8),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#faf5ff')]),
-    ]))
-    story.append(tbl)
+    yield static_paragraph("12.2 Key Innovation Points", rl.SUBHEADING_STYLE)
+    
+    tbl = LongTable(_INNOVATIONS_DATA, colWidths=[w*inch for w in _INNOVATIONS_WIDTHS], repeatRows=1)
+    tbl.setStyle(rl.INNOVATIONS_TABLE_STYLE)
+    yield tbl
     
-    story.append(Spacer(1, 0.3*inch))
-    story.append(Paragraph("12.3 Educational Value", subheading_style))
-    story.append(Paragraph("""
+    yield Spacer(1, 0.3*inch)
+    yield static_paragraph("12.3 Educational Value", rl.SUBHEADING_STYLE)
+    yield static_paragraph("""
     <b>For Students:</b><br/>
     • Understand quantum mechanics principles (superposition, measurement, entanglement)<br/>
     • Learn cryptography concepts (privacy amplification, QBER analysis, key derivation)<br/>
@@ -819,35 +1046,120 @@ def create_hackathon_pdf():
     • Modular codebase for implementing QKD variants (E91, B92, etc.)<br/>
     • Baseline for performance comparison studies<br/>
     • Framework for exploring privacy amplification strategies
-    """, normal_style))
+    """, rl.NORMAL_STYLE)
     
-    story.append(Spacer(1, 0.2*inch))
-    story.append(Paragraph("12.4 Future Enhancements", subheading_style))
-    story.append(Paragraph("""
+    yield Spacer(1, 0.2*inch)
+    yield static_paragraph("12.4 Future Enhancements", rl.SUBHEADING_STYLE)
+    yield static_paragraph("""
     • Integration with actual quantum hardware (IBM Quantum, IonQ)<br/>
     • Support for additional QKD protocols (E91, B92, Decoy-State BB84)<br/>
     • Multi-user real-time BB84 protocol execution over network<br/>
     • Cryptographic strength analysis with key generation rate metrics<br/>
     • Advanced attacks implementation (collective measurement, side-channel attacks)<br/>
     • Blockchain integration for distributed key management
-    """, normal_style))
+    """, rl.NORMAL_STYLE)
+    
+    yield Spacer(1, 0.4*inch)
+    yield static_paragraph("Thank you for reviewing this comprehensive BB84 Quantum Key Distribution Simulator!",
+                           rl.THANKS_STYLE)
+    
+    yield Spacer(1, 0.1*inch)
+    yield static_paragraph("Team Silicon | JNTUA ECE Department", rl.FOOTER_STYLE)
+
+# Numbered sections 1-12, each starting on a fresh page
+_SECTION_BUILDERS = (
+    _executive_summary_flowables,
+    _uniqueness_flowables,
+    _protocol_flowables,
+    _architecture_flowables,
+    _hash_function_flowables,
+    _bloch_sphere_flowables,
+    _frontend_flowables,
+    _backend_flowables,
+    _tech_stack_flowables,
+    _performance_flowables,
+    _security_flowables,
+    _conclusion_flowables,
+)
+
+def _hackathon_doc_template(target, generated_date):
+    """Return an A4 guide document that reuses the shared page templates.
+
+    The first page is the canvas-drawn title page showing generated_date.
+    """
+    from reportlab.lib.pagesizes import A4
+    from reportlab.platypus import BaseDocTemplate
+    rl = _get_reportlab()
+    # Compressed, deterministic content streams (the cache relies on the latter)
+    doc = BaseDocTemplate(target, pagesize=A4,
+                          rightMargin=rl.MARGIN, leftMargin=rl.MARGIN,
+                          topMargin=rl.MARGIN, bottomMargin=rl.MARGIN,
+                          pageCompression=1, invariant=1)
+    doc.generated_date = generated_date
+    doc.addPageTemplates([rl.TITLE_PAGE_TEMPLATE, rl.PAGE_TEMPLATE])
+    return doc
+
+def _render_hackathon_pdf(date_str, section_ids):
+    """Lay out the title page, TOC and the given sections (0-based) and return the PDF bytes"""
+    from reportlab.platypus import NextPageTemplate, PageBreak
     
-    story.append(Spacer(1, 0.4*inch))
-    story.append(Paragraph("Thank you for reviewing this comprehensive BB84 Quantum Key Distribution Simulator!", 
-                          ParagraphStyle('thanks', parent=styles['Normal'], fontSize=11, 
-                                       textColor=colors.HexColor('#2563eb'), alignment=TA_CENTER, fontName='Helvetica-Bold')))
+    target = io.BytesIO()
+    # Page 1 is drawn by the title template; the flow starts on page 2
+    front_matter = itertools.chain((NextPageTemplate('main'), PageBreak()), _toc_flowables())
     
-    story.append(Spacer(1, 0.1*inch))
-    story.append(Paragraph("Team Silicon | JNTUA ECE Department", 
-                          ParagraphStyle('footer', parent=styles['Normal'], fontSize=9, 
-                                       textColor=colors.HexColor('#666666'), alignment=TA_CENTER)))
+    # Build PDF (from shallow copies, since ReportLab records layout state on flowables)
+    sections = (itertools.chain((PageBreak(),), _SECTION_BUILDERS[section_id]())
+                for section_id in section_ids)
+    story = itertools.chain(front_matter, itertools.chain.from_iterable(sections))
+    _hackathon_doc_template(target, date_str).build([copy.copy(flowable) for flowable in story])
     
-    # Build PDF
-    doc.build(story)
+    return target.getvalue()
+
+@lru_cache(maxsize=8)
+def _hackathon_pdf_bytes(date_str, section_ids):
+    """Return the guide PDF for a date and section list, memoised in-process.
+
+    Within one process the PDF only depends on the date and the section list,
+    so repeat downloads reuse the bytes instead of re-running ReportLab.
+    """
+    return _render_hackathon_pdf(date_str, section_ids)
+
+def create_hackathon_pdf(output=None, sections=None):
+    """Create comprehensive implementation guide PDF
+    
+    Args:
+        output: Optional file-like object to stream the PDF into. When omitted
+            the PDF is rendered in memory and its bytes are returned, e.g. for
+            st.download_button.
+        sections: Optional section numbers (1-12) to include after the title
+            page and TOC, e.g. [5, 6] for a quick preview. Defaults to all.
+    
+    Returns:
+        The output file-like object if given, otherwise the PDF bytes
+    """
+    
+    if sections is None:
+        section_ids = tuple(range(len(_SECTION_BUILDERS)))
+    else:
+        section_ids = tuple(sorted({number - 1 for number in sections}))
+        if section_ids and not (0 <= section_ids[0] and section_ids[-1] < len(_SECTION_BUILDERS)):
+            raise ValueError(f"sections must be numbers from 1 to {len(_SECTION_BUILDERS)}")
+    
+    pdf_bytes = _hackathon_pdf_bytes(_generated_date(date.today()), section_ids)
+    
+    if output is None:
+        return pdf_bytes
+    output.write(pdf_bytes)
+    return output
+
+def save_hackathon_pdf(pdf_path=DEFAULT_PDF_PATH):
+    """Write the implementation guide to pdf_path and return the path"""
+    # A failed build never leaves a truncated PDF at pdf_path
+    write_atomic(pdf_path, create_hackathon_pdf())
     print(f"✅ PDF generated successfully: {pdf_path}")
     return pdf_path
 
 if __name__ == "__main__":
-    pdf_path = create_hackathon_pdf()
+    pdf_path = save_hackathon_pdf()
     print(f"\nPDF Location: {pdf_path}")
     print("This document is ready for hackathon judges!")
@@ -78,6 +78,7 @@ import streamlit as st
 import base64
 import hashlib
 import time
+import uuid
 from datetime import datetime
 import numpy as np
 import pandas as pd
@@ -496,15 +497,15 @@ import bb84_config as config
 from bb84_simulator import BB84Simulator
 from bb84_utils import (
     create_transmission_timeline,
+    sift_key_with_metrics,
     compute_metrics,
-    analyze_error_patterns,
     calculate_key_rate,
     get_basis_distribution,
     get_bit_distribution,
     calculate_eve_impact
 )
 from bb84_visualizations import (
-    plot_pdf_style_timeline,
+    pdf_style_timeline_png,
     plotly_bit_timeline,
     plotly_error_timeline,
     qber_gauge,
@@ -553,6 +554,7 @@ def _initialize_session_state():
         st.session_state.setdefault("timeline_range_eve_start", 0)
         st.session_state.setdefault("timeline_range_eve_end", 0)
         st.session_state.setdefault("active_tab", "Timeline Analysis")
+        st.session_state.setdefault("downloads_run_id", None)
 
         # CACHED VISUALIZATION OBJECTS - PERFORMANCE OPTIMIZATION
         st.session_state.setdefault("cached_figures", {})
@@ -646,9 +648,8 @@ def run_bb84_simulation():
         sim = BB84Simulator()
         
         # Generate random bits and bases for Alice and Bob
-        alice_bits = np.random.randint(0, 2, num_bits)
-        alice_bases = np.random.randint(0, 2, num_bits)
-        bob_bases = np.random.randint(0, 2, num_bits)
+        # One (3, N) draw; each row is a contiguous view
+        alice_bits, alice_bases, bob_bases = sim.rng.integers(0, 2, (3, num_bits), dtype=np.int8)
         
         # Store in session state for use in visualizations
         st.session_state.alice_bits_stored = alice_bits
@@ -669,27 +670,38 @@ def run_bb84_simulation():
         
         progress_bar.progress(75, text="Analyzing results...")
 
-        # Compute timelines and metrics
+        # Compute metrics straight from the arrays; the timeline DataFrames
+        # are only built when a view asks for them (see scenario_timeline)
+        basis_match = alice_bases == bob_bases
+
         def compute_scenario(bob_results):
             """Compute metrics for a scenario"""
-            timeline = create_transmission_timeline(alice_bits, alice_bases, bob_bases, bob_results)
-            used = timeline[timeline["Used"] == True]
+            sifted_key, metrics = sift_key_with_metrics(
+                alice_bits, alice_bases, bob_bases, bob_results, threshold
+            )
             
-            errors = int(np.sum(used["Error"].values))
-            qber = errors / len(used) if len(used) > 0 else 0.0
+            errors = metrics['error_count']
+            qber = metrics['qber']
             sec = sim.assess_security(float(qber), float(threshold))
             
-            sifted_key = used["AliceBit"].astype(int).tolist()
-            final_key = sim.privacy_amplification(sifted_key, qber) if sec['status'] == "SECURE" else []
+            final_key = (sim.privacy_amplification(sifted_key, qber) if sec['status'] == "SECURE"
+                         else np.zeros(0, dtype=np.uint8))
+            sifted_bob = bob_results[basis_match].astype(np.uint8)
+            sifted_alice = sifted_key.astype(np.uint8)
 
             return {
-                'timeline': timeline,
                 'errors': errors,
                 'qber': qber,
                 'status': sec['status'],
-                'sifted_count': len(used),
+                'sifted_count': metrics['sifted_count'],
                 'final_key_length': len(final_key),
-                'final_key': final_key
+                'final_key': final_key,
+                # Sifted bits for the comparison table, no timeline needed
+                'sifted_alice': sifted_alice,
+                'sifted_bob': sifted_bob,
+                'sifted_match': sifted_alice == sifted_bob,
+                # '0'/'1' text of the key, built once in C for display/download
+                'final_key_str': (final_key + ord('0')).astype(np.uint8).tobytes().decode('ascii')
             }
 
         no_eve_results = compute_scenario(bob_no_eve)
@@ -710,7 +722,10 @@ def run_bb84_simulation():
                 'eve_attack': eve_attack,
                 'noise_prob': noise_prob,
                 'window': window
-            }
+            },
+            # Fixed per run so the cached PDF report is reused across reruns
+            'generated_on': datetime.now().strftime("%d-%m-%Y %H:%M:%S"),
+            'run_id': uuid.uuid4().hex
         }
 
         progress_bar.empty()
@@ -772,7 +787,7 @@ def render_final_key_download():
     with key_col1:
         st.markdown("**No Eve Scenario Key:**")
         if no_eve['final_key_length'] > 0:
-            key_no_str = ''.join(map(str, no_eve['final_key']))
+            key_no_str = no_eve['final_key_str']
             st.code(key_no_str[:100] + "..." if len(key_no_str) > 100 else key_no_str, language="text")
             st.caption(f"Length: {len(key_no_str)} bits | Status: {no_eve['status']}")
         else:
@@ -781,7 +796,7 @@ def render_final_key_download():
     with key_col2:
         st.markdown("**With Eve Scenario Key:**")
         if eve['final_key_length'] > 0:
-            key_eve_str = ''.join(map(str, eve['final_key']))
+            key_eve_str = eve['final_key_str']
             st.code(key_eve_str[:100] + "..." if len(key_eve_str) > 100 else key_eve_str, language="text")
             st.caption(f"Length: {len(key_eve_str)} bits | Status: {eve['status']}")
         else:
@@ -792,7 +807,7 @@ def render_final_key_download():
     dl_col1, dl_col2 = st.columns(2)
     with dl_col1:
         if no_eve['final_key_length'] > 0:
-            key_no_bytes = ''.join(map(str, no_eve['final_key'])).encode('utf-8')
+            key_no_bytes = no_eve['final_key_str'].encode('ascii')
             st.download_button(
                 label=" **Download No Eve Key**",
                 data=key_no_bytes,
@@ -802,7 +817,7 @@ def render_final_key_download():
             )
     with dl_col2:
         if eve['final_key_length'] > 0:
-            key_eve_bytes = ''.join(map(str, eve['final_key'])).encode('utf-8')
+            key_eve_bytes = eve['final_key_str'].encode('ascii')
             st.download_button(
                 label=" **Download With Eve Key**",
                 data=key_eve_bytes,
@@ -1083,7 +1098,7 @@ def render_error_analysis():
     with err_col1:
         st.markdown("**No Eve Error Distribution:**")
         if no_eve['errors'] > 0:
-            error_indices = no_eve['timeline'][no_eve['timeline']['Error']==True]['BitIndex'].tolist()[:10]
+            error_indices = scenario_error_positions('no_eve', 10)
             st.markdown(f"Errors found at positions: {error_indices}...")
         else:
             st.markdown("No errors detected in No Eve scenario.")
@@ -1091,7 +1106,7 @@ def render_error_analysis():
     with err_col2:
         st.markdown("**With Eve Error Distribution:**")
         if eve['errors'] > 0:
-            error_indices = eve['timeline'][eve['timeline']['Error']==True]['BitIndex'].tolist()[:10]
+            error_indices = scenario_error_positions('eve', 10)
             st.markdown(f"Errors found at positions: {error_indices}...")
         else:
             st.markdown("No unexpected errors detected.")
@@ -1114,12 +1129,11 @@ def render_sifted_key_display():
         st.markdown(f"**No Eve - First {min(sifted_display_size, no_eve['sifted_count'])} Sifted Bits**")
         if no_eve['sifted_count'] > 0:
             show_n = min(sifted_display_size, no_eve['sifted_count'])
-            used_no = no_eve['timeline'][no_eve['timeline']["Used"] == True]
             df_no = pd.DataFrame({
-                "Alice": used_no["AliceBit"].iloc[:show_n].values,
-                "Bob": used_no["BobResult"].iloc[:show_n].values,
-                "Match": used_no["Error"].iloc[:show_n].apply(lambda x: not x).values
-            })
+                "Alice": no_eve['sifted_alice'][:show_n],
+                "Bob": no_eve['sifted_bob'][:show_n],
+                "Match": no_eve['sifted_match'][:show_n]
+            }, copy=False)
             st.dataframe(df_no, key="sifted_df_no", use_container_width=True, hide_index=True)
         else:
             st.info("No sifted bits available")
@@ -1128,12 +1142,11 @@ def render_sifted_key_display():
         st.markdown(f"**With Eve - First {min(sifted_display_size, eve['sifted_count'])} Sifted Bits**")
         if eve['sifted_count'] > 0:
             show_n = min(sifted_display_size, eve['sifted_count'])
-            used_e = eve['timeline'][eve['timeline']["Used"] == True]
             df_e = pd.DataFrame({
-                "Alice": used_e["AliceBit"].iloc[:show_n].values,
-                "Bob": used_e["BobResult"].iloc[:show_n].values,
-                "Match": used_e["Error"].iloc[:show_n].apply(lambda x: not x).values
-            })
+                "Alice": eve['sifted_alice'][:show_n],
+                "Bob": eve['sifted_bob'][:show_n],
+                "Match": eve['sifted_match'][:show_n]
+            }, copy=False)
             st.dataframe(df_e, key="sifted_df_e", use_container_width=True, hide_index=True)
         else:
             st.info("No sifted bits available")
@@ -1147,14 +1160,64 @@ def render_sifted_key_display():
     )
 
 
+@st.cache_data(max_entries=8, show_spinner=False)
+def build_timeline_cached(alice_bits, alice_bases, bob_bases, bob_results):
+    """Build a scenario's timeline DataFrame once per set of qubit arrays. Cached across reruns."""
+    return create_transmission_timeline(alice_bits, alice_bases, bob_bases, bob_results)
+
+
+def scenario_timeline(scenario):
+    """Timeline DataFrame for the 'no_eve' or 'eve' scenario, built on first use"""
+    return build_timeline_cached(*_scenario_arrays(scenario))
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def timeline_csv_cached(alice_bits, alice_bases, bob_bases, bob_results):
+    """Serialise a scenario's timeline to CSV once per set of qubit arrays. Cached across reruns."""
+    return build_timeline_cached(alice_bits, alice_bases, bob_bases, bob_results).to_csv(index=False)
+
+
+def scenario_timeline_csv(scenario):
+    """Timeline CSV text for the 'no_eve' or 'eve' scenario"""
+    return timeline_csv_cached(*_scenario_arrays(scenario))
+
+
+def scenario_error_positions(scenario, limit):
+    """First `limit` sifted-bit error positions of a scenario, read straight from the qubit arrays"""
+    alice_bits, alice_bases, bob_bases, bob_results = _scenario_arrays(scenario)
+    errors = (alice_bases == bob_bases) & (alice_bits != bob_results)
+    return np.flatnonzero(errors)[:limit].tolist()
+
+
+def _scenario_arrays(scenario):
+    """The qubit arrays a scenario's timeline is built from"""
+    return (
+        st.session_state.alice_bits_stored,
+        st.session_state.alice_bases_stored,
+        st.session_state.bob_bases_stored,
+        st.session_state.sim_results[f'bob_{scenario}']
+    )
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def timeline_png_cached(timeline_df, title, max_bits, color_scheme):
+    """Render a PDF-style timeline to PNG once per timeline/settings. Cached across reruns."""
+    return pdf_style_timeline_png(timeline_df, title=title, max_bits=max_bits, color_scheme=color_scheme)
+
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+def bloch_sphere_cached(bit_basis_pairs):
+    """Bloch sphere figure for a tuple of (bit, basis) pairs. Cached across reruns."""
+    states = [BB84Simulator.get_statevector_from_bit_basis(bit, basis) for bit, basis in bit_basis_pairs]
+    return plotly_bloch_sphere(states)
+
+
 @st.fragment
 def render_timeline_analysis():
     """Display timeline visualizations. UI-only."""
     if not st.session_state.simulation_completed or st.session_state.sim_results is None:
         return
 
-    no_eve = st.session_state.sim_results['no_eve']
-    eve = st.session_state.sim_results['eve']
     pdf_max = st.session_state.pdf_max
 
     st.markdown("### Timeline Analysis")
@@ -1165,26 +1228,27 @@ def render_timeline_analysis():
     with viz_col2:
         show_plotly = st.checkbox("Interactive Plotly Timeline", value=True)
 
+    # Timelines are only built while at least one view of them is switched on
+    if not (show_pdf or show_plotly):
+        return
+    timeline_no = scenario_timeline('no_eve')
+    timeline_e = scenario_timeline('eve')
+
     tl_col1, tl_col2 = st.columns(2)
     
     with tl_col1:
         st.markdown("**No Eavesdropper Scenario**")
         if show_pdf:
             try:
-                fig_pdf_no = plot_pdf_style_timeline(
-                    no_eve['timeline'], 
-                    title="No Eve Scenario", 
-                    max_bits=pdf_max, 
-                    color_scheme='blue'
-                )
-                st.pyplot(fig_pdf_no, use_container_width=True)
+                png_no = timeline_png_cached(timeline_no, "No Eve Scenario", pdf_max, 'blue')
+                st.image(png_no, use_container_width=True)
             except Exception as e:
                 pass
         
         if show_plotly:
             st.markdown("---")
             st.markdown("**Plotly Timeline (Interactive)**")
-            max_no = len(no_eve['timeline']) - 1
+            max_no = len(timeline_no) - 1
             if st.session_state.timeline_range_no_end == 0:
                 st.session_state.timeline_range_no_end = min(max_no, 100)
             
@@ -1197,12 +1261,12 @@ def render_timeline_analysis():
             )
 
             st.plotly_chart(
-                plotly_bit_timeline(no_eve['timeline'], start_no, end_no, title="No Eve - Plotly Timeline"),
+                plotly_bit_timeline(timeline_no, start_no, end_no, title="No Eve - Plotly Timeline"),
                 use_container_width=True,
                 key="plotly_timeline_no"
             )
             st.plotly_chart(
-                plotly_error_timeline(no_eve['timeline'], start_no, end_no, title="No Eve - Error Timeline"),
+                plotly_error_timeline(timeline_no, start_no, end_no, title="No Eve - Error Timeline"),
                 use_container_width=True,
                 key="plotly_err_no"
             )
@@ -1211,20 +1275,15 @@ def render_timeline_analysis():
         st.markdown("**Eavesdropper Present Scenario**")
         if show_pdf:
             try:
-                fig_pdf_e = plot_pdf_style_timeline(
-                    eve['timeline'], 
-                    title="With Eve Scenario", 
-                    max_bits=pdf_max, 
-                    color_scheme='red'
-                )
-                st.pyplot(fig_pdf_e, use_container_width=True)
+                png_e = timeline_png_cached(timeline_e, "With Eve Scenario", pdf_max, 'red')
+                st.image(png_e, use_container_width=True)
             except Exception as e:
                 pass
         
         if show_plotly:
             st.markdown("---")
             st.markdown("**Plotly Timeline (Interactive)**")
-            max_e = len(eve['timeline']) - 1
+            max_e = len(timeline_e) - 1
             if st.session_state.timeline_range_eve_end == 0:
                 st.session_state.timeline_range_eve_end = min(max_e, 100)
             
@@ -1237,12 +1296,12 @@ def render_timeline_analysis():
             )
 
             st.plotly_chart(
-                plotly_bit_timeline(eve['timeline'], start_e, end_e, title="With Eve - Plotly Timeline"),
+                plotly_bit_timeline(timeline_e, start_e, end_e, title="With Eve - Plotly Timeline"),
                 use_container_width=True,
                 key="plotly_timeline_e"
             )
             st.plotly_chart(
-                plotly_error_timeline(eve['timeline'], start_e, end_e, title="With Eve - Error Timeline"),
+                plotly_error_timeline(timeline_e, start_e, end_e, title="With Eve - Error Timeline"),
                 use_container_width=True,
                 key="plotly_err_e"
             )
@@ -1307,7 +1366,6 @@ def render_bloch_visualizations():
                 if idx < len(bits_array):
                     bit = int(bits_array[idx])
                     basis = int(bases_array[idx])
-                    sv = BB84Simulator.get_statevector_from_bit_basis(bit, basis)
                     
                     state_col1, state_col2 = st.columns([1, 2])
                     with state_col1:
@@ -1323,7 +1381,7 @@ def render_bloch_visualizations():
 """, unsafe_allow_html=True)
                     with state_col2:
                         try:
-                            fig = plotly_bloch_sphere([sv])
+                            fig = bloch_sphere_cached(((bit, basis),))
                             st.plotly_chart(fig, use_container_width=True, key=f"bloch_single_{idx}")
                         except Exception as e:
                             pass
@@ -1387,15 +1445,14 @@ Error loading Single Qubit Analysis. Please refresh and try again.
                 st.session_state.bloch_range_start = start
                 st.session_state.bloch_range_end = end
 
-                states = []
-                state_info = []
-                for i in range(start, end + 1):
-                    if i < len(bits_array):
-                        bit = int(bits_array[i])
-                        basis = int(bases_array[i])
-                        sv = BB84Simulator.get_statevector_from_bit_basis(bit, basis)
-                        states.append(sv)
-                        state_info.append(f"Qubit {i}: {BB84Simulator.state_label(bit, basis)}")
+                states = tuple(zip(
+                    np.asarray(bits_array[start:end + 1]).tolist(),
+                    np.asarray(bases_array[start:end + 1]).tolist()
+                ))
+                state_info = [
+                    f"Qubit {i}: {BB84Simulator.state_label(bit, basis)}"
+                    for i, (bit, basis) in enumerate(states, start)
+                ]
 
                 st.markdown("**Quantum States in Range:**")
                 for info in state_info:
@@ -1404,7 +1461,7 @@ Error loading Single Qubit Analysis. Please refresh and try again.
                 if states:
                     try:
                         st.markdown("**3D Bloch Sphere Multi-State View:**")
-                        fig = plotly_bloch_sphere(states)
+                        fig = bloch_sphere_cached(states)
                         st.plotly_chart(fig, use_container_width=True, key=f"bloch_range_{start}_{end}")
                     except Exception as e:
                         pass
@@ -1430,8 +1487,11 @@ No states to display in selected range.
             """, unsafe_allow_html=True)
         else:
             try:
-                bases_array = st.session_state.alice_bases_stored
-                bits_array = st.session_state.alice_bits_stored
+                bases_array = np.asarray(st.session_state.alice_bases_stored)
+                bits_array = np.asarray(st.session_state.alice_bits_stored)
+                z_mask = bases_array == 0
+                x_mask = ~z_mask
+                zero_mask = bits_array == 0
                 
                 # Section 1: Z-Basis
                 st.markdown("""
@@ -1483,10 +1543,9 @@ No states to display in selected range.
                 
                 with pol_col2:
                     st.markdown("**Z-Basis Distribution**")
-                    z_bits = [i for i, b in enumerate(bases_array) if b == 0]
-                    z_0 = sum(1 for i in z_bits if bits_array[i] == 0)
-                    z_1 = sum(1 for i in z_bits if bits_array[i] == 1)
-                    z_total = len(z_bits)
+                    z_total = int(np.count_nonzero(z_mask))
+                    z_0 = int(np.count_nonzero(z_mask & zero_mask))
+                    z_1 = z_total - z_0
                     
                     if z_total > 0:
                         z_0_percent = (z_0 / z_total) * 100
@@ -1550,10 +1609,9 @@ No states to display in selected range.
                 
                 with pol_col4:
                     st.markdown("**X-Basis Distribution**")
-                    x_bits = [i for i, b in enumerate(bases_array) if b == 1]
-                    x_plus = sum(1 for i in x_bits if bits_array[i] == 0)
-                    x_minus = sum(1 for i in x_bits if bits_array[i] == 1)
-                    x_total = len(x_bits)
+                    x_total = int(np.count_nonzero(x_mask))
+                    x_plus = int(np.count_nonzero(x_mask & zero_mask))
+                    x_minus = x_total - x_plus
                     
                     if x_total > 0:
                         x_plus_percent = (x_plus / x_total) * 100
@@ -1614,8 +1672,8 @@ This means:
                 # Overall Statistics
                 st.markdown("## 4. Overall Polarization Statistics")
                 
-                total_z = len(z_bits)
-                total_x = len(x_bits)
+                total_z = int(np.count_nonzero(z_mask))
+                total_x = int(np.count_nonzero(x_mask))
                 total_qubits = total_z + total_x
                 
                 if total_qubits > 0:
@@ -1652,27 +1710,34 @@ In a proper BB84 protocol with **truly random basis selection**:
 
 # PDF REPORT GENERATION - WITH CACHING
 
-@st.cache_data(ttl=3600)
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
 def generate_pdf_report_bytes(
     project_info_tuple,
     summary_tuple,
-    timeline_csv_no_eve,
-    timeline_csv_eve,
+    run_id,
+    _timeline_csv_no_eve,
+    _timeline_csv_eve,
     num_bits,
     sift_no, key_no, qber_no,
     sift_e, key_e, qber_e,
     threshold,
     pdf_max_bits
 ):
-    """Generate PDF bytes. Cached to avoid recomputation."""
+    """Generate PDF bytes. Cached to avoid recomputation.
+    
+    Every argument is part of the cache key, so they must all stay fixed for a
+    given simulation run (no per-rerun timestamps). The timeline CSVs are
+    left out of the key (leading underscore); run_id identifies them instead,
+    so a lookup never hashes the full CSV text.
+    """
     project_info_dict = dict(project_info_tuple)
     summary_dict = dict(summary_tuple)
     
     return create_pdf_report_with_graphs(
         project_info=project_info_tuple,
         summary=summary_tuple,
-        timeline_df_no_eve_csv=timeline_csv_no_eve,
-        timeline_df_eve_csv=timeline_csv_eve,
+        timeline_df_no_eve_csv=_timeline_csv_no_eve,
+        timeline_df_eve_csv=_timeline_csv_eve,
         num_bits=num_bits,
         sift_no=sift_no, key_no=key_no, qber_no=qber_no,
         sift_e=sift_e, key_e=key_e, qber_e=qber_e,
@@ -1710,7 +1775,7 @@ def render_report_downloads():
         "Department": "ECE",
         "Project": "AQVH FINAL: BB84 QKD Simulator",
         "Team": "Team Silicon",
-        "Generated On": datetime.now().strftime("%d-%m-%Y %H:%M:%S"),
+        "Generated On": st.session_state.sim_results['generated_on'],
         "Total Qubits": params['num_bits'],
         "Eve Probability": params['eve_prob'],
         "Eve Attack": params['eve_attack'],
@@ -1727,23 +1792,30 @@ def render_report_downloads():
         "With Eve Key": eve['final_key_length']
     }
 
-    # Generate PDF with caching
-    project_info_tuple = tuple(sorted(project_info.items()))
-    summary_tuple = tuple(sorted(summary.items()))
-    timeline_csv_no_eve = no_eve['timeline'].to_csv(index=False)
-    timeline_csv_eve = eve['timeline'].to_csv(index=False)
-
-    pdf_bytes = generate_pdf_report_bytes(
-        project_info_tuple,
-        summary_tuple,
-        timeline_csv_no_eve,
-        timeline_csv_eve,
-        params['num_bits'],
-        no_eve['sifted_count'], no_eve['final_key_length'], no_eve['qber'],
-        eve['sifted_count'], eve['final_key_length'], eve['qber'],
-        params['threshold'],
-        st.session_state.pdf_max
-    )
+    # The CSVs and the PDF are only built once asked for, then served from
+    # the per-run caches for the rest of this run
+    run_id = st.session_state.sim_results['run_id']
+    if st.session_state.downloads_run_id != run_id:
+        if st.button(" **Prepare Report Downloads**", help="Build the CSV and PDF files for this simulation run"):
+            st.session_state.downloads_run_id = run_id
+        else:
+            return
+
+    with st.spinner("Building report files..."):
+        timeline_csv_no_eve = scenario_timeline_csv('no_eve')
+        timeline_csv_eve = scenario_timeline_csv('eve')
+        pdf_bytes = generate_pdf_report_bytes(
+            tuple(sorted(project_info.items())),
+            tuple(sorted(summary.items())),
+            run_id,
+            timeline_csv_no_eve,
+            timeline_csv_eve,
+            params['num_bits'],
+            no_eve['sifted_count'], no_eve['final_key_length'], no_eve['qber'],
+            eve['sifted_count'], eve['final_key_length'], eve['qber'],
+            params['threshold'],
+            st.session_state.pdf_max
+        )
 
     dl_col1, dl_col2, dl_col3 = st.columns(3)
     
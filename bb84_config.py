@@ -37,6 +37,7 @@ BLOCH_SPHERE_HEIGHT = 600
 GAUGE_HEIGHT = 320
 TIMELINE_HEIGHT = 420
 ERROR_TIMELINE_HEIGHT = 280
+TIMELINE_MAX_POINTS = 1200  # Points per Plotly bit-timeline trace before M4 downsampling
 
 # Colors
 COLOR_GRADIENT_1_START = "#667eea"
@@ -50,6 +51,7 @@ SIMULATOR_METHOD = "statevector"
 SIMULATOR_DEVICE = "GPU"  # Use GPU if available, fallback to CPU
 SIMULATOR_DEVICE = "CPU"
 SIMULATOR_SHOTS = 1
+ANALYTIC_SAMPLER = True  # Sample BB84 outcomes with numpy; False runs the Qiskit circuits
 
 # Eve Attack Types
 EVE_ATTACK_TYPES = ["Intercept-Resend"]
@@ -0,0 +1,44 @@
+# BB84 Guide Utils Module - Shared helpers for the PDF guide generators
+from functools import lru_cache
+import os
+
+def lazy_getattr(module_name, names, loader):
+    """Return a PEP 562 module __getattr__ that serves names from loader()
+
+    Lets a guide module expose its ReportLab styles as module attributes
+    while only importing ReportLab when one of them is first accessed.
+
+    Args:
+        module_name: __name__ of the module, for the AttributeError message
+        names: Attribute names served lazily
+        loader: Zero-argument callable returning an object holding those names
+
+    Returns:
+        function: The module-level __getattr__
+    """
+    def __getattr__(name):
+        if name in names:
+            return getattr(loader(), name)
+        raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+    return __getattr__
+
+@lru_cache(maxsize=None)
+def static_paragraph(text, style):
+    """Return the Paragraph for fixed guide text, parsing its markup only once"""
+    from reportlab.platypus import Paragraph
+    return Paragraph(text, style)
+
+def write_atomic(path, data):
+    """Write bytes to path through a sibling temp file renamed into place
+
+    Readers never see a partial file, and a failed write leaves whatever was
+    already at path untouched.
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as tmp_file:
+            tmp_file.write(data)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
@@ -6,11 +6,30 @@ from qiskit_aer import AerSimulator
 from qiskit.quantum_info import Statevector
 import bb84_config as config
 
+# The four BB84 states keyed by (bit, basis): |0⟩, |1⟩, |+⟩, |−⟩
+_BB84_STATES = {
+    (0, 0): Statevector([1, 0]),
+    (1, 0): Statevector([0, 1]),
+    (0, 1): Statevector([1 / np.sqrt(2), 1 / np.sqrt(2)]),
+    (1, 1): Statevector([1 / np.sqrt(2), -1 / np.sqrt(2)]),
+}
+
 class BB84Simulator:
     """Optimized BB84 Quantum Key Distribution Simulator using Qiskit"""
     
-    def __init__(self):
-        """Initialize the simulator with optimal settings"""
+    def __init__(self, analytic=None, seed=None):
+        """Initialize the simulator with optimal settings
+        
+        Args:
+            analytic: Sample measurement outcomes with numpy instead of running
+                Qiskit circuits (default config.ANALYTIC_SAMPLER)
+            seed: Seed for the simulator's random Generator (None = fresh entropy)
+        """
+        self.analytic = config.ANALYTIC_SAMPLER if analytic is None else analytic
+        # One PCG64 Generator for every random draw of this simulator
+        self.rng = np.random.default_rng(seed)
+        # Transpiled measurement circuits keyed by (bit, basis, measurement basis)
+        self._circuit_cache = {}
         try:
             self.simulator = AerSimulator(
                 method=config.SIMULATOR_METHOD,
@@ -86,104 +105,118 @@ class BB84Simulator:
         
         Returns:
             tuple: (bob_results, eve_results)
-                   bob_results: List of Bob's measurement outcomes
-                   eve_results: List of Eve's measurement outcomes (None if no Eve)
+                   bob_results: int8 array of Bob's measurement outcomes
+                   eve_results: int8 array of Eve's measurement outcomes (None if no Eve)
         """
         # Vectorize input conversion with efficient data types
-        alice_bits = np.asarray([int(b) for b in list(alice_bits)], dtype=np.int8)
-        alice_bases = np.asarray([int(b) for b in list(alice_bases)], dtype=np.int8)
-        bob_bases = np.asarray([int(b) for b in list(bob_bases)], dtype=np.int8)
+        alice_bits = np.asarray(alice_bits, dtype=np.int8)
+        alice_bases = np.asarray(alice_bases, dtype=np.int8)
+        bob_bases = np.asarray(bob_bases, dtype=np.int8)
         
         n = len(alice_bits)
-        bob_results = np.zeros(n, dtype=np.int8)
         eve_results = np.zeros(n, dtype=np.int8) if eve_present else None
         eve_bases = None
         eve_intercepts = None
         
         if eve_present:
-            eve_bases = np.random.randint(0, 2, n, dtype=np.int8)
+            eve_bases = self.rng.integers(0, 2, n, dtype=np.int8)
             # Pre-generate all intercept decisions for vectorization
             # eve_intercepts[i] = True if Eve intercepts qubit i, False otherwise
             # Probability of True is eve_intercept_prob
             # This means: for n qubits, approximately n*eve_intercept_prob will be True
-            eve_intercepts = np.random.random(n) < eve_intercept_prob
+            eve_intercepts = self.rng.random(n) < eve_intercept_prob
+        
+        # A qubit's outcome only depends on (bit, preparation basis,
+        # measurement basis), so every phase is either sampled analytically
+        # or runs at most 8 distinct circuits as one multi-shot job
+        measure = self._measure_analytic if self.analytic else self._measure_grouped
+        sent_bits, sent_bases = alice_bits, alice_bases
+        
+        # CRITICAL SECTION: EVE INTERCEPTION LOGIC
+        if eve_present and eve_intercepts.any():
+            # ===== EVE MEASURES THE QUBIT =====
+            # Eve doesn't know which basis Alice used (it's secret!)
+            # So Eve measures each intercepted qubit in her random basis
+            intercepted = np.flatnonzero(eve_intercepts)
+            eve_results[intercepted] = measure(
+                alice_bits[intercepted], alice_bases[intercepted], eve_bases[intercepted])
+            
+            # ERROR INTRODUCTION HAPPENS HERE:
+            # If eve_bases[i] == alice_bases[i] (50% chance): Eve gets CORRECT bit
+            # If eve_bases[i] != alice_bases[i] (50% chance): Eve gets RANDOM bit
+            # When Eve got wrong bit and resends it, Bob will measure it wrong
+            # This introduces ~25% error in final sifted key
+            
+            # ===== EVE RESENDS THE QUBIT =====
+            # Bob now receives a NEW qubit prepared with Eve's result in
+            # Eve's basis instead of Alice's original for intercepted qubits
+            sent_bits = np.where(eve_intercepts, eve_results, alice_bits)
+            sent_bases = np.where(eve_intercepts, eve_bases, alice_bases)
         
-        # Optimized batch processing for maximum speed
-        batch_size = config.BATCH_SIZE
+        # Bob measures every qubit he received in his own basis
+        bob_results = measure(sent_bits, sent_bases, bob_bases)
         
-        for batch_start in range(0, n, batch_size):
-            batch_end = min(batch_start + batch_size, n)
-            batch_indices = np.arange(batch_start, batch_end)
-            
+        # Apply channel noise efficiently
+        if noise_prob > 0:
+            bob_results ^= (self.rng.random(n) < noise_prob).view(np.int8)
+        
+        # Arrays, not lists: one byte per bit instead of a Python int object
+        return bob_results, eve_results
+    
+    def _measure_analytic(self, bits, bases, measure_bases):
+        """Sample measurement outcomes for BB84 states without a simulator
+        
+        A BB84 state measured in its own basis returns the encoded bit;
+        measured in the other basis it returns a fair coin flip. This has the
+        same outcome statistics as the Qiskit circuits in _measure_grouped.
+        
+        Returns:
+            np.ndarray: int8 measurement outcomes, one per qubit
+        """
+        coins = self.rng.integers(0, 2, len(bits), dtype=np.int8)
+        return np.where(bases == measure_bases, bits, coins).astype(np.int8)
+    
+    def _measure_grouped(self, bits, bases, measure_bases):
+        """Measure each qubit (bits[i] prepared in bases[i]) in measure_bases[i]
+        
+        Qubits are grouped by (bit, basis, measurement basis); each group's
+        circuit is built and transpiled once per simulator, so back-to-back
+        scenarios and Eve's measure/resend phases reuse it, and all groups run
+        in a single job with enough shots for the largest group. Shots are
+        independent, so group members take consecutive outcomes from that
+        circuit's per-shot memory.
+        
+        Returns:
+            np.ndarray: int8 measurement outcomes, one per qubit
+        """
+        outcomes = np.zeros(len(bits), dtype=np.int8)
+        if len(bits) == 0:
+            return outcomes
+        
+        group_keys = (bits * 4 + bases * 2 + measure_bases).astype(np.int8)
+        groups = [(key, np.flatnonzero(group_keys == key)) for key in np.unique(group_keys)]
+        
+        missing = [int(key) for key, _ in groups if int(key) not in self._circuit_cache]
+        if missing:
             circuits = []
-            
-            for i in batch_indices:
-                qc = QuantumCircuit(1, 1)
-                
-                # Encode Alice's bit into circuit
-                if alice_bits[i] == 1:
-                    qc.x(0)
-                
-                # CRITICAL SECTION: EVE INTERCEPTION LOGIC
-                # Handle Eve interception if present and if she intercepts THIS qubit
-                if eve_present and eve_intercepts[i]:
-                    # ===== EVE MEASURES THE QUBIT =====
-                    # Eve doesn't know which basis Alice used (it's secret!)
-                    # So Eve chooses a random basis (Z or X)
-                    if eve_bases[i] == 1:  # If Eve chose X-basis
-                        qc.h(0)  # Apply Hadamard gate to measure in X-basis
-                    
-                    qc.measure(0, 0)  # Measure the qubit
-                    # Run the measurement quantum circuit
-                    job_eve = self.simulator.run(transpile(qc, self.simulator), shots=1)
-                    res_eve = job_eve.result().get_counts()
-                    eve_results[i] = int(list(res_eve.keys())[0])  # Record Eve's measurement
-                    
-                    # ERROR INTRODUCTION HAPPENS HERE:
-                    # If eve_bases[i] == alice_bases[i] (50% chance): Eve gets CORRECT bit
-                    # If eve_bases[i] != alice_bases[i] (50% chance): Eve gets RANDOM bit
-                    # When Eve got wrong bit and resends it, Bob will measure it wrong
-                    # This introduces ~25% error in final sifted key
-                    
-                    # ===== EVE RESENDS THE QUBIT =====
-                    # Create a NEW qubit based on Eve's measurement result
-                    # This qubit will be sent to Bob (not Alice's original qubit)
-                    qc = QuantumCircuit(1, 1)
-                    if eve_results[i] == 1:  # If Eve measured 1
-                        qc.x(0)  # Prepare bit 1
-                    if eve_bases[i] == 1:  # In Eve's chosen basis
-                        qc.h(0)  # Prepare in X-basis if Eve chose X
-                    
-                    # Important: Bob will now measure this Eve-resent qubit (not Alice's original)
-                    
-                else:
-                    # Eve doesn't intercept this qubit
-                    # Alice's original qubit travels unmodified to Bob
-                    # Apply Alice's basis so Bob receives the correctly-encoded qubit
-                    if alice_bases[i] == 1:
-                        qc.h(0)
-                
-                # Apply Bob's measurement basis
-                if bob_bases[i] == 1:
+            for key in missing:
+                qc = self.encode_qubit(key >> 2 & 1, key >> 1 & 1)
+                if key & 1:
                     qc.h(0)
                 qc.measure(0, 0)
                 circuits.append(qc)
-            
-            # Run batch with optimized transpilation (level 3 for maximum optimization)
-            if circuits:
-                transpiled = transpile(circuits, self.simulator, optimization_level=3)
-                job = self.simulator.run(transpiled, shots=1)
-                results = job.result()
-                
-                for idx, i in enumerate(batch_indices):
-                    counts = results.get_counts(idx)
-                    bob_results[i] = int(list(counts.keys())[0])
-                    
-                    # Apply channel noise efficiently
-                    if noise_prob > 0 and np.random.random() < noise_prob:
-                        bob_results[i] = 1 - bob_results[i]
-        
-        return bob_results.tolist(), eve_results.tolist() if eve_present else None
+            compiled = transpile(circuits, self.simulator, optimization_level=3)
+            self._circuit_cache.update(zip(missing, compiled))
+        
+        transpiled = [self._circuit_cache[int(key)] for key, _ in groups]
+        shots = max(len(indices) for _, indices in groups)
+        results = self.simulator.run(transpiled, shots=shots, memory=True,
+                                     seed_simulator=int(self.rng.integers(2**31))).result()
+        
+        for idx, (_, indices) in enumerate(groups):
+            memory = results.get_memory(idx)[:len(indices)]
+            outcomes[indices] = np.asarray(memory, dtype='U1').astype(np.int8)
+        return outcomes
     
     @staticmethod
     def privacy_amplification(sifted_key, error_rate, 
@@ -230,15 +263,16 @@ class BB84Simulator:
                                  - Probability of successful attack allowed
         
         Returns:
-            list: Amplified secure key bits (smaller but unconditionally secure)
+            np.ndarray: Amplified secure key bits as uint8 (smaller but unconditionally secure)
         """
         if target_security_level is None:
             target_security_level = config.TARGET_SECURITY_LEVEL
             
-        sifted_key = np.array([int(b) for b in list(sifted_key)], dtype=np.int8)
+        # Bits may be Python ints, bools or numpy ints; one C-level cast
+        sifted_key = np.asarray(sifted_key, dtype=np.int8)
         n = len(sifted_key)
         if n == 0:
-            return []
+            return np.zeros(0, dtype=np.uint8)
 
         # Improved Shannon entropy calculation
         e = float(np.clip(error_rate, 0.0, 1.0))
@@ -253,23 +287,22 @@ class BB84Simulator:
         secure_length = max(0, int(secure_length))
 
         if secure_length == 0:
-            return []
+            return np.zeros(0, dtype=np.uint8)
 
-        # Use SHA-256 for better hash properties
-        key_str = ''.join(str(int(b)) for b in sifted_key)
-        digest = hashlib.sha256(key_str.encode()).hexdigest()
-        binary_hash = bin(int(digest, 16))[2:].zfill(256)
-        
-        # Extract secure bits with additional hashing if needed
-        final_bits = [int(b) for b in binary_hash[:secure_length]]
+        # Use SHA-256 for better hash properties. The hash input is the key as
+        # '0'/'1' text, built in one numpy pass instead of a str join
+        key_bytes = (sifted_key + ord('0')).astype(np.uint8).tobytes()
+        # unpackbits is MSB-first, the same bit order as bin(int(hexdigest, 16))
+        hash_bits = np.unpackbits(np.frombuffer(hashlib.sha256(key_bytes).digest(), dtype=np.uint8))
         
         # If need more bits, use SHA-512 as secondary source
         if secure_length > 256:
-            digest2 = hashlib.sha512(key_str.encode()).hexdigest()
-            binary_hash2 = bin(int(digest2, 16))[2:].zfill(512)
-            final_bits.extend([int(b) for b in binary_hash2[:secure_length - 256]])
+            hash_bits = np.concatenate((
+                hash_bits,
+                np.unpackbits(np.frombuffer(hashlib.sha512(key_bytes).digest(), dtype=np.uint8)),
+            ))
 
-        return final_bits[:secure_length]
+        return hash_bits[:secure_length]
     
     @staticmethod
     def assess_security(qber, threshold=None):
@@ -325,10 +358,6 @@ class BB84Simulator:
                   - action: 'PROCEED_WITH_KEY' or 'ABORT_AND_RETRY'
                   - color: 'green' or 'red' for UI display
         """
-        
-        Returns:
-            dict: Security assessment
-        """
         if threshold is None:
             threshold = config.DEFAULT_QBER_THRESHOLD
             
@@ -358,12 +387,7 @@ class BB84Simulator:
         Returns:
             Statevector: Quantum state vector
         """
-        qc = QuantumCircuit(1)
-        if int(bit) == 1:
-            qc.x(0)
-        if int(basis) == 1:
-            qc.h(0)
-        return Statevector.from_instruction(qc)
+        return _BB84_STATES[(int(bit), int(basis))]
     
     @staticmethod
     def state_label(bit, basis):
@@ -3,6 +3,9 @@ import numpy as np
 import pandas as pd
 import bb84_config as config
 
+# Timeline ErrorType categories, in code order
+_ERROR_TYPES = ('None', 'Basis Mismatch', 'Transmission Error')
+
 def create_transmission_timeline(alice_bits, alice_bases, bob_bases, bob_results):
     """Create detailed timeline DataFrame for BB84 transmission (OPTIMIZED)
     
@@ -15,14 +18,12 @@ def create_transmission_timeline(alice_bits, alice_bases, bob_bases, bob_results
     Returns:
         pd.DataFrame: Timeline with full transmission details
     """
-    alice_bits = np.asarray(alice_bits, dtype=np.int8)
-    alice_bases = np.asarray(alice_bases, dtype=np.int8)
-    bob_bases = np.asarray(bob_bases, dtype=np.int8)
-    bob_results = np.asarray(bob_results, dtype=np.int8)
+    alice_bits, alice_bases, bob_bases, bob_results, matches, errors = _sift_masks(
+        alice_bits, alice_bases, bob_bases, bob_results)
     
-    # Vectorized operations for maximum speed
-    matches = (alice_bases == bob_bases)
-    errors = (alice_bits != bob_results) & matches
+    # ErrorType as a categorical over int8 codes: no per-row Python strings
+    # (0 = None, 1 = Basis Mismatch, 2 = Transmission Error)
+    error_codes = np.where(~matches, 1, errors * 2).astype(np.int8)
     
     n = len(alice_bits)
     timeline_data = {
@@ -34,12 +35,42 @@ def create_transmission_timeline(alice_bits, alice_bases, bob_bases, bob_results
         'BaseMatch': matches,
         'Used': matches,
         'Error': errors,
-        'ErrorType': np.where(~matches, 'Basis Mismatch', 
-                             np.where(errors, 'Transmission Error', 'None'))
+        'ErrorType': pd.Categorical.from_codes(error_codes, _ERROR_TYPES)
     }
     
     return pd.DataFrame(timeline_data)
 
+def sift_key_with_metrics(alice_bits, alice_bases, bob_bases, bob_results, qber_threshold):
+    """Sift the key and compute its metrics straight from the qubit arrays
+    
+    No DataFrame is built; use this when only the key and the numbers are
+    needed and the timeline can be created later for display.
+    
+    Args:
+        alice_bits: Alice's transmitted bits
+        alice_bases: Alice's bases
+        bob_bases: Bob's bases
+        bob_results: Bob's measurement results
+        qber_threshold: QBER threshold value
+    
+    Returns:
+        tuple: (sifted key as int8 array, metrics dict as from compute_metrics())
+    """
+    alice_bits, _, _, _, matches, errors = _sift_masks(alice_bits, alice_bases, bob_bases, bob_results)
+    return alice_bits[matches], _metrics_from_masks(matches, errors, qber_threshold)
+
+def _sift_masks(alice_bits, alice_bases, bob_bases, bob_results):
+    """Return the four inputs as int8 arrays plus the basis-match and error masks"""
+    alice_bits = np.asarray(alice_bits, dtype=np.int8)
+    alice_bases = np.asarray(alice_bases, dtype=np.int8)
+    bob_bases = np.asarray(bob_bases, dtype=np.int8)
+    bob_results = np.asarray(bob_results, dtype=np.int8)
+    
+    # Vectorized operations for maximum speed
+    matches = (alice_bases == bob_bases)
+    errors = (alice_bits != bob_results) & matches
+    return alice_bits, alice_bases, bob_bases, bob_results, matches, errors
+
 def compute_metrics(timeline_df, qber_threshold):
     """Compute detailed metrics from timeline (OPTIMIZED)
     
@@ -50,9 +81,17 @@ def compute_metrics(timeline_df, qber_threshold):
     Returns:
         dict: Computed metrics
     """
-    used = timeline_df[timeline_df["Used"] == True]
+    # Count straight off the boolean columns instead of materialising the
+    # filtered DataFrame
+    used = timeline_df["Used"].to_numpy(dtype=bool)
+    errors = timeline_df["Error"].to_numpy(dtype=bool) & used
+    return _metrics_from_masks(used, errors, qber_threshold)
+
+def _metrics_from_masks(used, errors, qber_threshold):
+    """Compute the compute_metrics() dict from the Used and Error masks"""
+    sifted_count = int(np.count_nonzero(used))
     
-    if len(used) == 0:
+    if sifted_count == 0:
         return {
             'sifted_count': 0,
             'error_count': 0,
@@ -63,17 +102,17 @@ def compute_metrics(timeline_df, qber_threshold):
             'is_secure': True
         }
     
-    error_count = int(np.sum(used["Error"].values))
-    qber = error_count / len(used) if len(used) > 0 else 0.0
-    correct_count = len(used) - error_count
+    error_count = int(np.count_nonzero(errors))
+    qber = error_count / sifted_count
+    correct_count = sifted_count - error_count
     
     return {
-        'sifted_count': len(used),
+        'sifted_count': sifted_count,
         'error_count': error_count,
         'correct_count': correct_count,
         'qber': float(qber),
-        'accuracy': correct_count / len(used) if len(used) > 0 else 0.0,
-        'efficiency': len(used) / len(timeline_df) if len(timeline_df) > 0 else 0.0,
+        'accuracy': correct_count / sifted_count,
+        'efficiency': sifted_count / len(used),
         'is_secure': qber <= qber_threshold
     }
 
@@ -86,9 +125,10 @@ def analyze_error_patterns(timeline_df):
     Returns:
         dict: Error analysis statistics
     """
-    used = timeline_df[timeline_df["Used"] == True]
+    used = timeline_df["Used"].to_numpy(dtype=bool)
+    sifted_count = int(np.count_nonzero(used))
     
-    if len(used) == 0:
+    if sifted_count == 0:
         return {
             'error_indices': [],
             'error_count': 0,
@@ -96,23 +136,23 @@ def analyze_error_patterns(timeline_df):
             'error_percentage': 0.0
         }
     
-    errors = used[used["Error"] == True]
-    error_indices = errors["BitIndex"].tolist()
+    error_positions = np.flatnonzero(timeline_df["Error"].to_numpy(dtype=bool) & used)
+    error_array = timeline_df["BitIndex"].to_numpy()[error_positions]
+    error_count = len(error_array)
     
-    # Calculate consecutive error runs with vectorization
+    # Longest run of consecutive error indices: runs end wherever the gap
+    # between neighbouring indices is not 1
     consecutive_errors = 0
-    if len(error_indices) > 0:
-        error_array = np.array(error_indices)
-        diffs = np.diff(error_array)
-        # Find where consecutive indices exist (diff == 1)
-        consecutive_runs = np.split(error_array, np.where(diffs != 1)[0] + 1)
-        consecutive_errors = max([len(run) for run in consecutive_runs]) if consecutive_runs else 0
+    if error_count > 0:
+        run_ends = np.flatnonzero(np.diff(error_array) != 1) + 1
+        run_bounds = np.concatenate(([0], run_ends, [error_count]))
+        consecutive_errors = int(np.diff(run_bounds).max())
     
     return {
-        'error_indices': error_indices[:20],
-        'error_count': len(errors),
+        'error_indices': error_array[:20].tolist(),
+        'error_count': error_count,
         'consecutive_errors': consecutive_errors,
-        'error_percentage': (len(errors) / len(used) * 100) if len(used) > 0 else 0.0
+        'error_percentage': error_count / sifted_count * 100
     }
 
 def calculate_key_rate(sifted_bits, final_key_length, total_qubits):
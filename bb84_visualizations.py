@@ -2,6 +2,8 @@
 import numpy as np
 import pandas as pd
 import io
+import matplotlib
+matplotlib.use("Agg")  # Headless rasteriser; charts are only saved to PNG/PDF
 import matplotlib.pyplot as plt
 import plotly.graph_objects as go
 from matplotlib.patches import Patch
@@ -117,10 +119,56 @@ def plot_pdf_style_timeline(timeline_df, title="BB84 Timeline", max_bits=50, col
     plt.tight_layout()
     return fig
 
+def pdf_style_timeline_png(timeline_df, title="BB84 Timeline", max_bits=50, color_scheme='blue', dpi=200):
+    """Render plot_pdf_style_timeline to PNG bytes at a fixed DPI
+    
+    Args:
+        timeline_df: Timeline DataFrame
+        title: Plot title
+        max_bits: Maximum bits to display
+        color_scheme: 'blue' for No Eve, 'red' for With Eve
+        dpi: Raster resolution (st.pyplot's default is 200)
+    
+    Returns:
+        bytes: PNG image, safe to cache since no Figure outlives the call
+    """
+    fig = plot_pdf_style_timeline(timeline_df, title=title, max_bits=max_bits, color_scheme=color_scheme)
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=dpi, bbox_inches="tight")
+    plt.close(fig)
+    return buf.getvalue()
+
 # ============================================================
 # PLOTLY INTERACTIVE TIMELINES
 # ============================================================
-def plotly_bit_timeline(timeline_df, start, end, title="Bit Timeline"):
+def _m4_positions(series, n_buckets):
+    """Positions kept by M4 downsampling of each series
+
+    The window is cut into n_buckets equal runs; from each run the first,
+    last, minimum and maximum sample of every series is kept, so every run
+    that contains a 0-to-1 flip still draws one.
+
+    Args:
+        series: Equal-length 1-D arrays sharing one x axis
+        n_buckets: Number of runs to cut the window into
+
+    Returns:
+        np.ndarray: Sorted unique positions into the window
+    """
+    n = len(series[0])
+    edges = np.linspace(0, n, n_buckets + 1).astype(np.intp)
+    firsts, lasts = edges[:-1], edges[1:] - 1
+    bucket = np.repeat(np.arange(n_buckets), np.diff(edges))
+    keep = [firsts, lasts]
+    for values in series:
+        # Sorted by (bucket, value): each run's first entry is its minimum
+        # and its last entry its maximum
+        order = np.lexsort((values, bucket))
+        keep += [order[firsts], order[lasts]]
+    return np.unique(np.concatenate(keep))
+
+def plotly_bit_timeline(timeline_df, start, end, title="Bit Timeline",
+                        max_points=config.TIMELINE_MAX_POINTS):
     """Create interactive bit timeline
     
     Args:
@@ -128,30 +176,47 @@ def plotly_bit_timeline(timeline_df, start, end, title="Bit Timeline"):
         start: Start index
         end: End index
         title: Plot title
+        max_points: Windows longer than this are M4-downsampled to about
+            this many points per trace; error markers are always all shown
     
     Returns:
         plotly.graph_objects.Figure: Interactive plot
     """
-    sliced = timeline_df[(timeline_df["BitIndex"] >= start) & (timeline_df["BitIndex"] <= end)].copy()
-
+    # Project just the columns drawn, then window them with one numpy mask
+    # instead of filtering and copying the whole DataFrame
+    bit_index = timeline_df["BitIndex"].to_numpy()
+    in_window = (bit_index >= start) & (bit_index <= end)
+    x = bit_index[in_window]
+    alice = timeline_df["AliceBit"].to_numpy()[in_window]
+    bob = timeline_df["BobResult"].to_numpy()[in_window]
+    errors = (timeline_df["Used"].to_numpy(dtype=bool) & timeline_df["Error"].to_numpy(dtype=bool))[in_window]
+    error_x, error_y = x[errors], bob[errors]
+
+    # Beyond a few points per pixel the extra samples only cost payload and
+    # tessellation, so long windows keep each bucket's extremes (6 per bucket)
+    if len(x) > max_points:
+        kept = _m4_positions((alice, bob), max(1, max_points // 6))
+        x, alice, bob = x[kept], alice[kept], bob[kept]
+
+    # WebGL traces: the browser rasterises markers on the GPU instead of
+    # building one SVG node per bit
     fig = go.Figure()
-    fig.add_trace(go.Scatter(
-        x=sliced["BitIndex"], y=sliced["AliceBit"],
+    fig.add_trace(go.Scattergl(
+        x=x, y=alice,
         mode="lines+markers", name="Alice Bit",
         marker=dict(color='#1E40AF', size=6),
         hovertemplate="Index=%{x}<br>Alice=%{y}<extra></extra>"
     ))
-    fig.add_trace(go.Scatter(
-        x=sliced["BitIndex"], y=sliced["BobResult"],
+    fig.add_trace(go.Scattergl(
+        x=x, y=bob,
         mode="lines+markers", name="Bob Result",
         marker=dict(color='#9CA3AF', size=6),
         hovertemplate="Index=%{x}<br>Bob=%{y}<extra></extra>"
     ))
 
-    err = sliced[(sliced["Used"] == True) & (sliced["Error"] == True)]
-    if len(err) > 0:
-        fig.add_trace(go.Scatter(
-            x=err["BitIndex"], y=err["BobResult"],
+    if len(error_x) > 0:
+        fig.add_trace(go.Scattergl(
+            x=error_x, y=error_y,
             mode="markers", name="Errors",
             marker=dict(size=12, symbol="x", color='red'),
             hovertemplate="Index=%{x}<br>ERROR<extra></extra>"
@@ -163,7 +228,8 @@ def plotly_bit_timeline(timeline_df, start, end, title="Bit Timeline"):
         yaxis_title="Bit (0/1)",
         yaxis=dict(tickmode="array", tickvals=[0, 1]),
         height=config.TIMELINE_HEIGHT,
-        hovermode='x unified'
+        hovermode='x unified',
+        uirevision=title  # keep zoom/legend state across slider reruns
     )
     return fig
 
@@ -179,19 +245,26 @@ def plotly_error_timeline(timeline_df, start, end, title="Error Timeline"):
     Returns:
         plotly.graph_objects.Figure: Interactive error plot
     """
-    sliced = timeline_df[(timeline_df["BitIndex"] >= start) & (timeline_df["BitIndex"] <= end)].copy()
-    y = ((sliced["Used"] == True) & (sliced["Error"] == True)).astype(int)
+    bit_index = timeline_df["BitIndex"].to_numpy()
+    in_window = (bit_index >= start) & (bit_index <= end)
+    errors = in_window & timeline_df["Used"].to_numpy(dtype=bool) & timeline_df["Error"].to_numpy(dtype=bool)
+    error_index = bit_index[errors]
 
+    # Zero-height bars draw nothing, so only the error positions are sent to
+    # the browser; fixed bar width and axis ranges keep the chart's geometry
     fig = go.Figure()
     fig.add_trace(go.Bar(
-        x=sliced["BitIndex"],
-        y=y,
+        x=error_index,
+        y=np.ones(len(error_index), dtype=np.int8),
+        width=0.8,
         name="Error",
         marker=dict(color='red')
     ))
     fig.update_layout(
         title=title,
         xaxis_title="Bit Index",
+        xaxis=dict(range=[start - 0.5, end + 0.5]),
+        yaxis=dict(range=[0, 1.05]),
         yaxis_title="Error Present",
         height=config.ERROR_TIMELINE_HEIGHT,
         showlegend=False
@@ -307,6 +380,18 @@ def qber_attack_detection_comparison(qber_no_eve, qber_eve, threshold):
 # ============================================================
 # ADVANCED BLOCH SPHERE VISUALIZATION
 # ============================================================
+def _make_sphere_mesh(resolution):
+    """Return the x, y, z surface grids of a unit sphere"""
+    u = np.linspace(0, 2 * np.pi, resolution)
+    v = np.linspace(0, np.pi, resolution)
+    return (np.outer(np.cos(u), np.sin(v)),
+            np.outer(np.sin(u), np.sin(v)),
+            np.outer(np.ones(resolution), np.cos(v)))
+
+# The sphere surface is the same for every figure, so it is built once.
+# 30x30 still looks smooth at 15% opacity and sends 2.8x fewer faces than 50x50
+_SPHERE_X, _SPHERE_Y, _SPHERE_Z = _make_sphere_mesh(30)
+
 def plotly_bloch_sphere(states, title="Bloch Sphere"):
     """Create advanced 3D Bloch sphere visualization
     
@@ -317,18 +402,11 @@ def plotly_bloch_sphere(states, title="Bloch Sphere"):
     Returns:
         plotly.graph_objects.Figure: 3D Bloch sphere
     """
-    # Create sphere mesh
-    u = np.linspace(0, 2 * np.pi, 50)
-    v = np.linspace(0, np.pi, 50)
-    x_sphere = np.outer(np.cos(u), np.sin(v))
-    y_sphere = np.outer(np.sin(u), np.sin(v))
-    z_sphere = np.outer(np.ones(np.size(u)), np.cos(v))
-
     fig = go.Figure()
     
-    # Add sphere surface
+    # Add sphere surface (shared precomputed mesh)
     fig.add_trace(go.Surface(
-        x=x_sphere, y=y_sphere, z=z_sphere,
+        x=_SPHERE_X, y=_SPHERE_Y, z=_SPHERE_Z,
         opacity=0.15, colorscale='Blues', showscale=False,
         name='Bloch Sphere'
     ))
@@ -368,21 +446,25 @@ def plotly_bloch_sphere(states, title="Bloch Sphere"):
     # Add quantum states
     colors_palette = ['orange', 'purple', 'cyan', 'magenta', 'yellow', 'lime']
     
-    for i, sv in enumerate(states):
-        if hasattr(sv, 'data'):
-            probs = np.abs(sv.data) ** 2
-            if len(probs) == 2:
-                theta = 2 * np.arccos(np.sqrt(probs[0]))
-                phi = np.angle(sv.data[1]) - np.angle(sv.data[0])
-            else:
-                continue
-        else:
-            theta, phi = sv
-
-        x_p = np.sin(theta) * np.cos(phi)
-        y_p = np.sin(theta) * np.sin(phi)
-        z_p = np.cos(theta)
-
+    # Convert all drawable states to Bloch coordinates in one vectorized pass
+    # (multi-qubit statevectors are skipped, as before)
+    indices = [i for i, sv in enumerate(states) if not hasattr(sv, 'data') or len(sv.data) == 2]
+    is_sv = np.array([hasattr(states[i], 'data') for i in indices], dtype=bool)
+    thetas = np.zeros(len(indices))
+    phis = np.zeros(len(indices))
+    if is_sv.any():
+        data = np.stack([states[i].data for i, sv_flag in zip(indices, is_sv) if sv_flag])
+        thetas[is_sv] = 2 * np.arccos(np.clip(np.abs(data[:, 0]), 0, 1))
+        phis[is_sv] = np.angle(data[:, 1]) - np.angle(data[:, 0])
+    if not is_sv.all():
+        thetas[~is_sv], phis[~is_sv] = np.array(
+            [states[i] for i, sv_flag in zip(indices, is_sv) if not sv_flag], dtype=float).T
+    sin_thetas = np.sin(thetas)
+    xs = sin_thetas * np.cos(phis)
+    ys = sin_thetas * np.sin(phis)
+    zs = np.cos(thetas)
+
+    for i, theta, phi, x_p, y_p, z_p in zip(indices, thetas, phis, xs, ys, zs):
         color = colors_palette[i % len(colors_palette)]
         
         # Add state point